@@ -1,14 +1,26 @@
 import argparse
+import atexit
+import copy
+import functools
 import os
+import platform
 import re
+import shutil
+import subprocess
 import sys
+import threading
+import weakref
+from collections import namedtuple
 from enum import Enum
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import IO, Dict, Iterator
+from xml.sax.saxutils import escape as xml_escape
 
 import docx.oxml.shared
 import markdown
-from bs4 import BeautifulSoup
+import yaml
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 from bs4.element import PageElement as BS4_Element
 from docx import Document as DOCX_Document
 from docx.enum.style import WD_STYLE_TYPE as DOCX_STYLE_TYPE
@@ -16,15 +28,43 @@ from docx.enum.table import WD_ALIGN_VERTICAL as DOCX_CELL_ALIGN_VERTICAL
 from docx.enum.text import WD_ALIGN_PARAGRAPH as DOCX_PARAGRAPH_ALIGN
 from docx.enum.text import WD_BREAK as DOCX_BREAK_TYPE
 from docx.opc.constants import RELATIONSHIP_TYPE as DOCX_REL
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-from docx.shared import Inches, Pt, RGBColor
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches, Length, Pt, RGBColor
 from docx.table import Table as DOCX_Table
 from docx.table import _Cell as DOCX_Cell
 from docx.text.font import Font as DOCX_FONT
 from docx.text.paragraph import Paragraph as DOCX_Paragraph
 from docx.text.parfmt import ParagraphFormat as DOCX_ParagraphFormat
 from docx.text.run import Run as DOCX_Run
+from yaml.parser import ParserError
+
+# Prefer the C-based lxml parser, falling back to the pure-Python one
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Prefer PyYAML's libyaml-based loader, falling back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+# Optional PDF converters
+try:
+    from docx2pdf import convert as _docx2pdf_convert
+except ImportError:
+    _docx2pdf_convert = None
+
+try:
+    import pythoncom as _pythoncom
+    import win32com.client as _win32com_client
+except ImportError:
+    _pythoncom = None
+    _win32com_client = None
 
 SCRIPT_DIR = Path(__file__).parent
 
@@ -36,9 +76,70 @@ DEFAULT_CONFIG_FILE = SCRIPT_DIR / "resume_config.yaml"
 DOCX_EXTENSION = "docx"
 PDF_EXTENSION = "pdf"
 DEFAULT_OUTPUT_FORMAT = DOCX_EXTENSION
-MD_LINK_PATTERN = re.compile(r"\[(.*?)\]\((.*?)\)")
-URL_PATTERN = re.compile(r"https?://[^\s]+|www\.[^\s]+")
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB
+# Top-level block elements emitted by markdown; anything else is skipped when parsing
+RESUME_TAGS = SoupStrainer(
+    ["h1", "h2", "h3", "h4", "h5", "h6", "p", "ul", "ol", "blockquote", "hr", "pre"]
+)
+URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
 EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# Markdown links are already <a> elements in the converted HTML
+LINK_PATTERN = re.compile(
+    f"(?P<url>{URL_PATTERN.pattern})|(?P<email>{EMAIL_PATTERN.pattern})"
+)
+# Characters add_run turns into w:tab and w:br elements instead of text
+RUN_CONTROL_CHARS = re.compile(r"[\t\n\r]")
+DEFAULT_LEFT_INDENT = Inches(0.25)
+PLATFORM_SYSTEM = platform.system()
+SENTENCE_ENDINGS = frozenset(".!?:;")
+# Heading tag groups checked while walking section elements
+SUBSECTION_HEADING_TAGS = frozenset(("h5", "h6"))
+MINOR_HEADING_TAGS = frozenset(("h4", "h5", "h6"))
+PROJECT_STOP_TAGS = frozenset(("h2", "h3", "h4", "h5"))
+SUBSECTION_STOP_TAGS = frozenset(("h2", "h3", "h4", "h5", "h6"))
+# Namespaced XML names set on many elements, resolved once instead of per call
+QN_W_VAL = qn("w:val")
+QN_W_W = qn("w:w")
+QN_W_TYPE = qn("w:type")
+QN_W_FILL = qn("w:fill")
+QN_W_SZ = qn("w:sz")
+QN_W_COLOR = qn("w:color")
+QN_W_FLD_CHAR_TYPE = qn("w:fldCharType")
+QN_W_P = qn("w:p")
+QN_R_ID = qn("r:id")
+QN_W_RPR = qn("w:rPr")
+QN_W_RFONTS = qn("w:rFonts")
+QN_W_THEME_FONT_ATTRS = tuple(
+    qn(f"w:{attr}") for attr in ("asciiTheme", "hAnsiTheme", "eastAsiaTheme", "cstheme")
+)
+# Markdown instances reused across conversions, see _markdown_to_html
+_MARKDOWN_CONVERTERS = threading.local()
+# LibreOffice profile of each batch conversion thread, see _convert_batch_with_libreoffice
+_LIBREOFFICE_PROFILES = threading.local()
+# Prebuilt w:rPr elements keyed by (bold, italic, font_size), see _run_properties_template
+_RUN_PROPERTIES_TEMPLATES = {}
+# Hyperlink relationship ids by URL for each document part, see _add_hyperlink
+_HYPERLINK_RIDS = weakref.WeakKeyDictionary()
+# Cell borders cleared on every side, copied into each cell by _create_table
+_NIL_CELL_BORDERS = parse_xml(
+    f"<w:tcBorders {nsdecls('w')}>"
+    + "".join(
+        f'<w:{border} w:val="nil"/>' for border in ("top", "left", "bottom", "right")
+    )
+    + "</w:tcBorders>"
+)
+# Hyperlink with a single Hyperlink-styled run, copied for each link by _add_hyperlink
+_HYPERLINK_TEMPLATE = parse_xml(
+    f"<w:hyperlink {nsdecls('w')}>"
+    '<w:r><w:rPr><w:rStyle w:val="Hyperlink"/></w:rPr></w:r>'
+    "</w:hyperlink>"
+)
+# Cell vertical alignments by name, see _cell_vertical_alignment
+_CELL_VERTICAL_ALIGNMENTS = {
+    "top": DOCX_CELL_ALIGN_VERTICAL.TOP,
+    "center": DOCX_CELL_ALIGN_VERTICAL.CENTER,
+    "bottom": DOCX_CELL_ALIGN_VERTICAL.BOTTOM,
+}
 
 
 ##############################
@@ -118,34 +219,34 @@ class JobSubsection(Enum):
         text_lower = text.lower().strip()
 
         # First try exact match
-        for subsection in cls:
-            if (
-                subsection.markdown_heading_level == tag_name
-                and text_lower == subsection.markdown_text_lower
-            ):
-                return subsection
+        subsection = _JOB_SUBSECTION_BY_TEXT.get((tag_name, text_lower))
+        if subsection:
+            return subsection
 
-        # If no exact match, try partial match for elements
-        # Create a dictionary of keywords to check against each subsection type
-        if tag_name in [
-            "h5",
-            "h6",
-        ]:  # Allow partial matching for both h5 and h6 elements
-            # Group subsections by heading level
-            matching_subsections = [
-                s for s in cls if s.markdown_heading_level == tag_name
-            ]
-
-            # Try partial matching against each subsection's keywords
-            for subsection in matching_subsections:
-                # Extract the first word of the markdown_text_lower as the key keyword
-                keyword = subsection.markdown_text_lower.split()[0]
-                if keyword in text_lower:
-                    return subsection
+        # If no exact match, try partial match against each subsection's keyword
+        for keyword, subsection in _JOB_SUBSECTION_KEYWORDS.get(tag_name, ()):
+            if keyword in text_lower:
+                return subsection
 
         return None
 
 
+# Lookup tables for JobSubsection.find_by_tag_and_text, built once
+_JOB_SUBSECTION_BY_TEXT = {
+    (s.markdown_heading_level, s.markdown_text_lower): s for s in JobSubsection
+}
+# The first word of the heading text is the keyword for partial matching,
+# which is allowed for h5 and h6 elements only
+_JOB_SUBSECTION_KEYWORDS = {
+    tag_name: [
+        (s.markdown_text_lower.split()[0], s)
+        for s in JobSubsection
+        if s.markdown_heading_level == tag_name
+    ]
+    for tag_name in ("h5", "h6")
+}
+
+
 class PdfConverterPaths(Enum):
     """Enum to store paths to PDF converter executables on different platforms"""
 
@@ -165,11 +266,17 @@ class PdfConverterPaths(Enum):
 ##############################
 # Helper Classes
 ##############################
+_SectionSpacing = namedtuple("_SectionSpacing", "h3_before h3_after h4_before h4_after")
+
+
 class ResumeSection:
     """Dynamic resume section configuration based on YAML config"""
 
-    _sections = {}
-    _section_order = []  # Preserve order from YAML
+    _sections = MappingProxyType({})
+    _section_order = ()  # Preserve order from YAML
+    _heading_lookup = {}  # markdown_heading_lower -> list of ResumeSection
+    _heading_index = {}  # section key -> h2 element, for _heading_index_soup
+    _heading_index_soup = None
     _initialized = False
 
     def __init__(self, key: str, config: Dict[str, str], order_index: int):
@@ -195,6 +302,14 @@ class ResumeSection:
         self.space_after_h4 = config.get("space_after_h4", None)
         self.order = order_index  # Use position in YAML as order
 
+        # Effective h3/h4 spacing, space before only applies when enabled
+        self.spacing = _SectionSpacing(
+            h3_before=self.space_before_h3 if self.add_space_before_h3 else None,
+            h3_after=self.space_after_h3,
+            h4_before=self.space_before_h4 if self.add_space_before_h4 else None,
+            h4_after=self.space_after_h4,
+        )
+
     def matches(self, text):
         """Check if the given text matches this section's markdown_heading (case insensitive)
 
@@ -214,17 +329,55 @@ class ResumeSection:
             resume_sections_config: Ordered dictionary containing all section configurations
                                   (order preserved from YAML)
         """
-        cls._sections = {}
-        cls._section_order = []
+        sections = {}
+        section_order = []
+        cls._heading_lookup = {}
+        cls._heading_index = {}
+        cls._heading_index_soup = None
 
         # Process sections in the order they appear in the YAML
         for order_index, (key, config) in enumerate(resume_sections_config.items()):
             section = cls(key, config, order_index)
-            cls._sections[key.upper()] = section
-            cls._section_order.append(section)
+            sections[key.upper()] = section
+            section_order.append(section)
+            cls._heading_lookup.setdefault(section.markdown_heading_lower, []).append(
+                section
+            )
 
+        # Read-only snapshots, so the accessors can return them without copying
+        cls._sections = MappingProxyType(sections)
+        cls._section_order = tuple(section_order)
         cls._initialized = True
 
+    @classmethod
+    def find_heading(
+        cls, soup: BeautifulSoup, section: "ResumeSection"
+    ) -> BS4_Element | None:
+        """Find the first h2 element matching a section's markdown_heading
+
+        All h2 elements are indexed in a single pass the first time a soup is
+        queried, so later lookups for the same soup are a dict access.
+
+        Args:
+            soup: BeautifulSoup object of the HTML content
+            section: The section to find the heading for
+
+        Returns:
+            BeautifulSoup element or None: The section heading element if found
+        """
+        cls._check_initialized()
+        if cls._heading_index_soup is not soup:
+            heading_index = {}
+            for h2 in soup.find_all("h2"):
+                text = h2.string
+                if text is None:
+                    continue
+                for matched in cls._heading_lookup.get(text.lower(), ()):
+                    heading_index.setdefault(matched.key, h2)
+            cls._heading_index = heading_index
+            cls._heading_index_soup = soup
+        return cls._heading_index.get(section.key)
+
     @classmethod
     def get_section(cls, key: str):
         """Get a section by key
@@ -243,20 +396,20 @@ class ResumeSection:
         """Get all resume sections in the order they appear in the YAML config
 
         Returns:
-            list: List of ResumeSection instances in YAML order
+            tuple: ResumeSection instances in YAML order
         """
         cls._check_initialized()
-        return cls._section_order.copy()
+        return cls._section_order
 
     @classmethod
     def all_sections(cls):
         """Get all sections as a dictionary
 
         Returns:
-            dict: Dictionary of section_key -> ResumeSection
+            MappingProxyType: Read-only mapping of section_key -> ResumeSection
         """
         cls._check_initialized()
-        return cls._sections.copy()
+        return cls._sections
 
     @classmethod
     def _check_initialized(cls):
@@ -307,7 +460,7 @@ class OutputFilePath:
         """
 
         default_output_name = self.input_file.with_suffix(f".{extension}").name
-        default_output_file = os.path.join(DEFAULT_OUTPUT_DIR, default_output_name)
+        default_output_file = DEFAULT_OUTPUT_DIR / default_output_name
         output_path = self.output_file
 
         if self.interactive:
@@ -320,7 +473,7 @@ class OutputFilePath:
         if self.interactive and not output_path:
             print(f"✅ Using default output: {default_output_file}")
 
-        return output
+        return Path(output)
 
 
 class ConfigLoader:
@@ -337,11 +490,6 @@ class ConfigLoader:
             print_success_msg (bool): Whether to print success message after loading.
                                    Defaults to False.
         """
-        from collections import OrderedDict
-
-        import yaml
-        from yaml.parser import ParserError
-
         # Default empty configuration structure
         self._config = {
             "document_defaults": {},
@@ -349,64 +497,54 @@ class ConfigLoader:
             "document_styles": {},
             "paragraph_lists": {},
             "markdown_headings": {},
-            "resume_sections": OrderedDict(),
+            "resume_sections": {},
         }
 
         # Try to load the YAML config file
-        if os.path.exists(config_file):
-            try:
-                # Use a custom YAML loader that preserves order
-                class OrderedLoader(yaml.SafeLoader):
-                    pass
-
-                def construct_mapping(loader, node):
-                    loader.flatten_mapping(node)
-                    return OrderedDict(loader.construct_pairs(node))
-
-                OrderedLoader.add_constructor(
-                    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, construct_mapping
-                )
-
-                with open(config_file, "r") as f:
-                    yaml_config = yaml.load(f, OrderedLoader)
-
-                if yaml_config and isinstance(yaml_config, dict):
-                    # Replace resume_sections if provided (preserving order)
-                    if "resume_sections" in yaml_config:
-                        self._config["resume_sections"] = yaml_config["resume_sections"]
-
-                    # Validate document styles after loading
-                    if "document_styles" in yaml_config:
-                        validated_styles = {}
+        try:
+            # Plain dicts keep the order of the YAML mappings
+            # (read as bytes, PyYAML detects the encoding itself)
+            with open(config_file, "rb") as f:
+                yaml_config = yaml.load(f, Loader=_YamlSafeLoader)
+
+            if yaml_config and isinstance(yaml_config, dict):
+                # Replace resume_sections if provided (preserving order)
+                if "resume_sections" in yaml_config:
+                    self._config["resume_sections"] = yaml_config["resume_sections"]
+
+                # Validate document styles after loading
+                if yaml_config.get("document_styles"):
+                    validate = _validate_style_properties
+                    self._config["document_styles"] = {
+                        style_name: validate(properties)
                         for style_name, properties in yaml_config[
                             "document_styles"
-                        ].items():
-                            validated_styles[style_name] = _validate_style_properties(
-                                properties
-                            )
-                        self._config["document_styles"] = validated_styles
-
-                    # Update other sections as before...
-                    for section in [
-                        "document_defaults",
-                        "style_constants",
-                        "paragraph_lists",
-                        "markdown_headings",
-                    ]:
-                        if section in yaml_config:
-                            if isinstance(yaml_config[section], dict) and isinstance(
-                                self._config.get(section, {}), dict
-                            ):
-                                self._config[section].update(yaml_config[section])
-                            else:
-                                self._config[section] = yaml_config[section]
-
-                    if print_success_msg:
-                        print(f"✅ Config loaded from {config_file}")
-            except (ParserError, Exception) as e:
-                print(
-                    f"❌ Error loading config file: {str(e)}, using default configuration"
-                )
+                        ].items()
+                    }
+
+                # Update other sections as before...
+                for section in [
+                    "document_defaults",
+                    "style_constants",
+                    "paragraph_lists",
+                    "markdown_headings",
+                ]:
+                    if section in yaml_config:
+                        if isinstance(yaml_config[section], dict) and isinstance(
+                            self._config.get(section, {}), dict
+                        ):
+                            self._config[section].update(yaml_config[section])
+                        else:
+                            self._config[section] = yaml_config[section]
+
+                if print_success_msg:
+                    print(f"✅ Config loaded from {config_file}")
+        except FileNotFoundError:
+            pass  # Keep the default configuration
+        except (ParserError, Exception) as e:
+            print(
+                f"❌ Error loading config file: {str(e)}, using default configuration"
+            )
 
     @property
     def two_column_enabled(self) -> bool:
@@ -415,6 +553,10 @@ class ConfigLoader:
             "two_column_enabled", False
         )
 
+    def enable_two_column(self) -> None:
+        """Switch the configuration to the two-column layout"""
+        self._config["document_defaults"]["two_column_enabled"] = True
+
     @property
     def contact_ribbon_enabled(self) -> bool:
         """Check if contact ribbon is enabled (default: False)"""
@@ -491,11 +633,60 @@ class ConfigLoader:
         return self.style_constants.get(key, default)
 
 
+def get_config_loader(
+    config_file: Path = DEFAULT_CONFIG_FILE, two_column: bool = False
+) -> ConfigLoader:
+    """Get a shared ConfigLoader for a config file, parsing the file only once
+
+    Loaders are cached by absolute path and modification time, so editing the
+    file invalidates the cached loader. The returned loader is shared between
+    callers and must not be modified; create a ConfigLoader directly to merge
+    in custom options.
+
+    Args:
+        config_file (Path): Path to the YAML configuration file
+        two_column (bool, optional): Force the two-column layout. Defaults to False.
+
+    Returns:
+        ConfigLoader: The cached configuration loader
+    """
+    config_path = Path(config_file).resolve()
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None  # ConfigLoader falls back to the default configuration
+    return _cached_config_loader(str(config_path), mtime_ns, two_column)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_config_loader(
+    config_path: str, mtime_ns: int | None, two_column: bool
+) -> ConfigLoader:
+    """Load a configuration file, cached by get_config_loader
+
+    Args:
+        config_path (str): Absolute path to the YAML configuration file
+        mtime_ns (int or None): Modification time of the file, part of the cache key
+        two_column (bool): Force the two-column layout
+
+    Returns:
+        ConfigLoader: The configuration loader
+    """
+    config_loader = ConfigLoader(Path(config_path), print_success_msg=False)
+    if two_column:
+        config_loader.enable_two_column()
+    return config_loader
+
+
 class ConfigHelper:
     """Static helper class for accessing configuration values globally"""
 
     # Class-level storage for configuration
     _config = None
+    _document_defaults = {}
+    _style_constants = {}
+    _document_styles = {}
+    _paragraph_lists = {}
     _initialized = False
 
     @classmethod
@@ -506,8 +697,17 @@ class ConfigHelper:
             config (dict): Complete configuration dictionary
         """
         cls._config = config
+        # Bind the sections once, the getters return them directly
+        cls._document_defaults = config.get("document_defaults", {})
+        cls._style_constants = config.get("style_constants", {})
+        cls._document_styles = config.get("document_styles", {})
+        cls._paragraph_lists = config.get("paragraph_lists", {})
         cls._initialized = True
 
+        # Drop settings cached from a previous configuration
+        _skills_config.cache_clear()
+        _cell_type_margins.cache_clear()
+
     @classmethod
     def get_document_defaults(cls) -> dict:
         """Get document default settings
@@ -516,7 +716,7 @@ class ConfigHelper:
             dict: Document defaults configuration
         """
         cls._check_initialized()
-        return cls._config.get("document_defaults", {})
+        return cls._document_defaults
 
     @classmethod
     def get_style_constants(cls) -> dict:
@@ -526,7 +726,7 @@ class ConfigHelper:
             dict: Style constants configuration
         """
         cls._check_initialized()
-        return cls._config.get("style_constants", {})
+        return cls._style_constants
 
     @classmethod
     def get_document_styles(cls) -> dict:
@@ -536,7 +736,7 @@ class ConfigHelper:
             dict: Document styles configuration
         """
         cls._check_initialized()
-        return cls._config.get("document_styles", {})
+        return cls._document_styles
 
     @classmethod
     def get_style_constant(cls, key: str, default=None):
@@ -550,7 +750,7 @@ class ConfigHelper:
             Value for the requested style constant or default if not found
         """
         cls._check_initialized()
-        return cls._config.get("style_constants", {}).get(key, default)
+        return cls._style_constants.get(key, default)
 
     @classmethod
     def get_paragraph_list_option(cls, list_type: str, option_name: str, default=None):
@@ -565,8 +765,7 @@ class ConfigHelper:
             The option value or default
         """
         cls._check_initialized()
-        list_config = cls._config.get("paragraph_lists", {})
-        type_config = list_config.get(list_type, {})
+        type_config = cls._paragraph_lists.get(list_type, {})
         return type_config.get(option_name, default)
 
     @classmethod
@@ -587,6 +786,9 @@ class HeadingsHelper:
 
     # Class-level storage for the heading configuration
     _heading_map = {}
+    _level_by_tag = {}
+    _size_by_tag = {}
+    _size_by_level = {}
     _initialized = False
 
     @classmethod
@@ -598,6 +800,19 @@ class HeadingsHelper:
         """
 
         cls._heading_map = headings_map
+
+        # Lookup tables, so the getters are a single dict access
+        cls._level_by_tag = {}
+        cls._size_by_tag = {}
+        cls._size_by_level = {}
+        for tag, props in headings_map.items():
+            cls._level_by_tag[tag] = props["level"]
+            cls._size_by_tag[tag] = props["paragraph_heading_size"]
+            # The first tag configured for a level determines its size
+            cls._size_by_level.setdefault(
+                props["level"], props["paragraph_heading_size"]
+            )
+
         cls._initialized = True
 
     @classmethod
@@ -611,9 +826,7 @@ class HeadingsHelper:
             int or None: The corresponding Word document heading level or None if not found
         """
         cls._check_initialized()
-        if tag_name.lower() in cls._heading_map:
-            return cls._heading_map[tag_name.lower()]["level"]
-        return None
+        return cls._level_by_tag.get(tag_name.lower())
 
     @classmethod
     def get_font_size_for_level(cls, heading_level: int, default_size: int = 11) -> int:
@@ -627,11 +840,7 @@ class HeadingsHelper:
             int: The font size in points
         """
         cls._check_initialized()
-        # Find the heading tag that corresponds to this level
-        for tag, props in cls._heading_map.items():
-            if props["level"] == heading_level:
-                return props["paragraph_heading_size"]
-        return default_size
+        return cls._size_by_level.get(heading_level, default_size)
 
     @classmethod
     def get_font_size_for_tag(cls, tag_name: str, default_size: int = 11) -> int:
@@ -645,10 +854,7 @@ class HeadingsHelper:
             int: The font size in points for the tag
         """
         cls._check_initialized()
-        tag_name = tag_name.lower()
-        if tag_name in cls._heading_map:
-            return cls._heading_map[tag_name]["paragraph_heading_size"]
-        return default_size
+        return cls._size_by_tag.get(tag_name.lower(), default_size)
 
     @classmethod
     def _check_initialized(cls) -> None:
@@ -738,36 +944,51 @@ class StylesHelper:
         """
         cls._check_initialized()
         style_properties = cls.get_all_style_properties()
+        # Section headings as they appear in the document, for a single set lookup
+        section_headings = {
+            section.docx_heading.upper()
+            for section in ResumeSection.get_ordered_sections()
+        }
+        # Style properties indexed by heading level, Normal style at index 0
+        styles_by_level = (style_properties["Normal"],) + tuple(
+            cls.get_style_for_heading_level(level) for level in range(1, 7)
+        )
+        # Run properties per level, headings are bold unless their style says otherwise
+        run_styles_by_level = (styles_by_level[0],) + tuple(
+            {**style, "bold": style.get("bold", True)} for style in styles_by_level[1:]
+        )
+        hyperlink_style = style_properties.get("Hyperlink", {})
 
         # Process each paragraph in the cell
         for paragraph in document.paragraphs:
+            runs = paragraph.runs
             text = paragraph.text.strip()
             if not text:
+                # Runs without text can only be hyperlinks by their underline
+                if hyperlink_style:
+                    for run in runs:
+                        if run.underline:
+                            _apply_font_properties(run.font, hyperlink_style)
                 continue
 
-            # Start with Normal style as base
-            normal = style_properties["Normal"]
-
-            # Check if all runs are bold (common heading indicator)
-            is_bold = all(run.bold for run in paragraph.runs if run.text.strip())
-
             # Method 1: Check if text matches any ResumeSection docx_heading - THE KEY FIX
             heading_level = None
-            for section in ResumeSection.get_ordered_sections():
-                # Case-insensitive comparison with the docx_heading
-                if text.upper() == section.docx_heading.upper():
-                    heading_level = 1  # Always use heading level 1 for section headings
-                    break
+            # Case-insensitive comparison with the docx_heading
+            if text.upper() in section_headings:
+                heading_level = 1  # Always use heading level 1 for section headings
+
+            # Check if all runs are bold (common heading indicator)
+            # Only needed by the methods below, so skipped for section headings
+            is_bold = not heading_level and all(
+                run.bold for run in runs if run.text.strip()
+            )
 
             # Method 2: Check font size if available
-            if not heading_level and paragraph.runs and is_bold:
-                first_run = paragraph.runs[0]
-                if (
-                    hasattr(first_run, "font")
-                    and hasattr(first_run.font, "size")
-                    and first_run.font.size
-                ):
-                    font_size = first_run.font.size.pt
+            if not heading_level and runs and is_bold:
+                # Runs always have a font, its size is None when not set directly
+                first_run_size = runs[0].font.size
+                if first_run_size:
+                    font_size = first_run_size.pt
                     if font_size >= 14:
                         heading_level = 1  # H1
                     elif font_size >= 12:
@@ -794,35 +1015,18 @@ class StylesHelper:
             # style_name = f"Heading {heading_level}" if heading_level else "Normal"
             # style = style_properties.get(style_name, normal)
 
-            style = (
-                cls.get_style_for_heading_level(heading_level)
-                if heading_level
-                else normal
-            )
+            style = styles_by_level[heading_level or 0]
+            run_style = run_styles_by_level[heading_level or 0]
 
-            # Apply style to all runs in paragraph
-            for run in paragraph.runs:
-                # Bold handling
-                if heading_level or "bold" in style:
-                    run_style = style.copy()
-                    run_style["bold"] = style.get("bold", heading_level is not None)
-                    _apply_font_properties(run.font, run_style)
-                else:
-                    _apply_font_properties(run.font, style)
+            # Apply style to all runs in paragraph, then the hyperlink style on top
+            for run in runs:
+                _apply_font_properties(run.font, run_style)
+                if hyperlink_style and (run.underline or _may_contain_link(run.text)):
+                    _apply_font_properties(run.font, hyperlink_style)
 
             # Apply paragraph formatting
             _apply_paragraph_format_properties(paragraph.paragraph_format, style)
 
-        # Special handling for hyperlinks
-        hyperlink_style = style_properties.get("Hyperlink", {})
-        if hyperlink_style:
-            for paragraph in document.paragraphs:
-                for run in paragraph.runs:
-                    if run.underline or (
-                        "http" in run.text or "www." in run.text or "@" in run.text
-                    ):
-                        _apply_font_properties(run.font, hyperlink_style)
-
     @classmethod
     def headings_map(cls) -> Dict[str, dict]:
         """Create a mapping of markdown headings to Word document styles
@@ -879,21 +1083,22 @@ class StylesHelper:
 ##############################
 def create_ats_resume(
     md_file: Path,
-    output_file: Path,
+    output_file: Path | IO[bytes],
     config_loader: ConfigLoader,
-) -> Path:
+) -> Path | IO[bytes]:
     """Convert markdown resume to ATS-friendly Word document
 
     Args:
         md_file (Path): Path to the markdown resume file
-        output_file (str): Path where the output Word document will be saved
+        output_file (str | IO[bytes]): Path where the output Word document will be saved,
+                                       or a writable binary stream (e.g. BytesIO)
         config_loader (ConfigLoader, optional): ConfigLoader instance with configuration.
                                                If None, creates with default config file.
         paragraph_style_headings (dict, optional): Dictionary mapping heading tags
                                                  to boolean values.
 
     Returns:
-        Path: Path to the created document
+        Path | IO[bytes]: Path to the created document, or the stream it was written to
     """
     # Initialize ResumeSection from config (order preserved from YAML)
     ResumeSection.init_from_config(config_loader.resume_sections)
@@ -908,13 +1113,12 @@ def create_ats_resume(
     style_constants = config_loader.style_constants
     document_styles = config_loader.document_styles
 
-    # Read markdown file
-    with open(md_file, "r") as file:
-        md_content = file.read()
+    # Read markdown file (newlines are normalized by the markdown converter)
+    md_content = Path(md_file).read_bytes().decode("utf-8")
 
     # Convert markdown to HTML for easier parsing
-    html = markdown.markdown(md_content)
-    soup = BeautifulSoup(html, "html.parser")
+    html = _markdown_to_html(md_content)
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=RESUME_TAGS)
 
     # Create document with standard margins
     document = DOCX_Document()
@@ -930,13 +1134,15 @@ def create_ats_resume(
         section.left_margin = Inches(doc_defaults["margin_left"])
         section.right_margin = Inches(doc_defaults["margin_right"])
 
-    contact_section = ResumeSection.get_section("CONTACT")
-    about_section = ResumeSection.get_section("ABOUT")
-    skills_section = ResumeSection.get_section("SKILLS")
-    certifications_section = ResumeSection.get_section("CERTIFICATIONS")
-    education_section = ResumeSection.get_section("EDUCATION")
-    experience_section = ResumeSection.get_section("EXPERIENCE")
-    projects_section = ResumeSection.get_section("PROJECTS")
+    # Section keys are stored upper case
+    sections = ResumeSection.all_sections()
+    contact_section = sections.get("CONTACT")
+    about_section = sections.get("ABOUT")
+    skills_section = sections.get("SKILLS")
+    certifications_section = sections.get("CERTIFICATIONS")
+    education_section = sections.get("EDUCATION")
+    experience_section = sections.get("EXPERIENCE")
+    projects_section = sections.get("PROJECTS")
 
     # Check if two-column layout is enabled
     use_two_column = config_loader.two_column_enabled
@@ -952,11 +1158,9 @@ def create_ats_resume(
         )
 
         # Process contact info in the contact cell (right after header, before about section)
-        contact_section = ResumeSection.get_section("CONTACT")
         if contact_section and contact_ribbon_enabled:
             _process_contact_info_horizontal(contact_info_cell, soup)
 
-        about_section = ResumeSection.get_section("ABOUT")
         if about_section:
             # Override space before to be minimal
             about_section.space_before_h2 = 0
@@ -1041,7 +1245,7 @@ def create_ats_resume(
         section_processor_map = {}
 
         # Insert contact ribbon processor in the correct place
-        if contact_ribbon_enabled and ResumeSection.get_section("CONTACT"):
+        if contact_ribbon_enabled and contact_section:
 
             def contact_ribbon_processor(doc, soup):
                 _process_contact_info_ribbon_single_column(doc, soup)
@@ -1060,7 +1264,7 @@ def create_ats_resume(
                     if (
                         section_type.key == "about"
                         and contact_ribbon_enabled
-                        and ResumeSection.get_section("CONTACT")
+                        and contact_section
                     ):
                         section_processors.append(
                             ("contact_ribbon", contact_ribbon_processor, False)
@@ -1068,46 +1272,42 @@ def create_ats_resume(
                     if section_type == about_section:
                         section_processor_map[about_section] = [
                             (
-                                lambda doc, soup: process_about_section(
-                                    document=doc, soup=soup
-                                ),
+                                process_about_section,
                                 False,
                             ),
                         ]
                     if section_type == skills_section:
                         section_processor_map[skills_section] = [
                             (
-                                lambda doc, soup: process_skills_section(doc, soup),
+                                process_skills_section,
                                 False,
                             ),
                         ]
                     if section_type == experience_section:
                         section_processor_map[experience_section] = [
                             (
-                                lambda doc, soup: process_experience_section(doc, soup),
+                                process_experience_section,
                                 False,
                             ),
                         ]
                     if section_type == projects_section:
                         section_processor_map[projects_section] = [
                             (
-                                lambda doc, soup: process_projects_section(doc, soup),
+                                process_projects_section,
                                 False,
                             ),
                         ]
                     if section_type == certifications_section:
                         section_processor_map[certifications_section] = [
                             (
-                                lambda doc, soup: process_certifications_section(
-                                    doc, soup
-                                ),
+                                process_certifications_section,
                                 False,
                             ),
                         ]
                     if section_type == education_section:
                         section_processor_map[education_section] = [
                             (
-                                lambda doc, soup: process_education_section(doc, soup),
+                                process_education_section,
                                 False,
                             ),
                         ]
@@ -1122,9 +1322,7 @@ def create_ats_resume(
                     if section_type == about_section:
                         section_processor_map[about_section] = [
                             (
-                                lambda doc, soup: process_about_section(
-                                    document=doc, soup=soup
-                                ),
+                                process_about_section,
                                 False,
                             ),
                         ]
@@ -1135,16 +1333,14 @@ def create_ats_resume(
                                 False,
                             )
                         )
-                        if contact_ribbon_enabled and ResumeSection.get_section(
-                            "CONTACT"
-                        ):
+                        if contact_ribbon_enabled and contact_section:
                             section_processors.append(
                                 ("contact_ribbon", contact_ribbon_processor, False)
                             )
                     elif section_type == skills_section:
                         section_processor_map[skills_section] = [
                             (
-                                lambda doc, soup: process_skills_section(doc, soup),
+                                process_skills_section,
                                 False,
                             ),
                         ]
@@ -1158,7 +1354,7 @@ def create_ats_resume(
                     elif section_type == experience_section:
                         section_processor_map[experience_section] = [
                             (
-                                lambda doc, soup: process_experience_section(doc, soup),
+                                process_experience_section,
                                 False,
                             ),
                         ]
@@ -1172,7 +1368,7 @@ def create_ats_resume(
                     elif section_type == projects_section:
                         section_processor_map[projects_section] = [
                             (
-                                lambda doc, soup: process_projects_section(doc, soup),
+                                process_projects_section,
                                 False,
                             ),
                         ]
@@ -1186,9 +1382,7 @@ def create_ats_resume(
                     elif section_type == certifications_section:
                         section_processor_map[certifications_section] = [
                             (
-                                lambda doc, soup: process_certifications_section(
-                                    doc, soup
-                                ),
+                                process_certifications_section,
                                 False,
                             ),
                         ]
@@ -1202,7 +1396,7 @@ def create_ats_resume(
                     elif section_type == education_section:
                         section_processor_map[education_section] = [
                             (
-                                lambda doc, soup: process_education_section(doc, soup),
+                                process_education_section,
                                 False,
                             ),
                         ]
@@ -1219,44 +1413,42 @@ def create_ats_resume(
                 section_processor_map[about_section] = [
                     (process_header_section, True),  # Header always required
                     (
-                        lambda doc, soup: process_about_section(
-                            document=doc, soup=soup
-                        ),
+                        process_about_section,
                         False,
                     ),
                 ]
 
             if skills_section:
                 section_processor_map[skills_section] = [
-                    (lambda doc, soup: process_skills_section(doc, soup), False),
+                    (process_skills_section, False),
                 ]
 
             if experience_section:
                 section_processor_map[experience_section] = [
-                    (lambda doc, soup: process_experience_section(doc, soup), False),
+                    (process_experience_section, False),
                 ]
 
             if projects_section:
                 section_processor_map[projects_section] = [
-                    (lambda doc, soup: process_projects_section(doc, soup), False),
+                    (process_projects_section, False),
                 ]
 
             if certifications_section:
                 section_processor_map[certifications_section] = [
                     (
-                        lambda doc, soup: process_certifications_section(doc, soup),
+                        process_certifications_section,
                         False,
                     ),
                 ]
 
             if education_section:
                 section_processor_map[education_section] = [
-                    (lambda doc, soup: process_education_section(doc, soup), False),
+                    (process_education_section, False),
                 ]
 
             if contact_section:
                 section_processor_map[contact_section] = [
-                    (lambda doc, soup: process_contact_section(doc, soup), False),
+                    (process_contact_section, False),
                 ]
 
             # Build section processors in YAML order
@@ -1268,6 +1460,16 @@ def create_ats_resume(
 
         # Process each section with error handling
         for section_type, processor, required in section_processors:
+            # Skip optional sections missing from the markdown without dispatching
+            if (
+                not required
+                and isinstance(section_type, ResumeSection)
+                and not ResumeSection.find_heading(soup, section_type)
+            ):
+                print(
+                    f"ℹ️  Section '{section_type.docx_heading}' not found in document"
+                )
+                continue
             try:
                 processor(document, soup)
             except Exception as e:
@@ -1281,9 +1483,15 @@ def create_ats_resume(
     # Add page numbers if enabled
     _add_configured_page_numbers(document)
 
-    # Save the document
-    document.save(output_file)
+    # Save the document, streams are written directly without a temporary file
+    # (unseekable streams such as HTTP bodies work too, zipfile supports them)
+    if hasattr(output_file, "write"):
+        document.save(output_file)
+        return output_file
 
+    # Files are written through a large buffer, so the zip is flushed in few writes
+    with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+        document.save(stream)
     return Path(output_file)
 
 
@@ -1307,24 +1515,18 @@ def _process_contact_info_ribbon_single_column(
         "item_separator_font_style", "normal"
     )
 
-    # Find the contact section h2
+    # Find the contact section h2 (the h2 index is shared with the other sections)
     contact_section = ResumeSection.get_section("CONTACT")
-    section_h2 = None
-    if contact_section:
-        for h2 in soup.find_all("h2"):
-            if h2.text.strip().lower() == contact_section.markdown_heading_lower:
-                section_h2 = h2
-                break
+    section_h2 = (
+        ResumeSection.find_heading(soup, contact_section) if contact_section else None
+    )
     if not section_h2:
         return
 
     # Gather contact info items (all <p> until next h2)
-    contact_items = []
-    current = section_h2.find_next_sibling()
-    while current and current.name != "h2":
-        if current.name == "p":
-            contact_items.append(current)
-        current = current.find_next_sibling()
+    contact_items = [
+        element for element in _section_elements(section_h2) if element.name == "p"
+    ]
 
     if not contact_items:
         return
@@ -1347,28 +1549,13 @@ def _process_contact_info_ribbon_single_column(
         tcBorders = OxmlElement("w:tcBorders")
         for border in ["top", "left", "bottom", "right", "insideH", "insideV"]:
             border_elem = OxmlElement(f"w:{border}")
-            border_elem.set(qn("w:val"), "nil")
+            border_elem.set(QN_W_VAL, "nil")
             tcBorders.append(border_elem)
         tcPr.append(tcBorders)
 
     wrapper_cell = wrapper_table.cell(0, 0)
     # Set cell margins for fine-grained spacing (in twips)
-    margin_top = ConfigHelper.get_style_constant(
-        "contact_cell_margin_top", ConfigHelper.get_style_constant("cell_margin_top", 3)
-    )
-    margin_bottom = ConfigHelper.get_style_constant(
-        "contact_cell_margin_bottom",
-        ConfigHelper.get_style_constant("cell_margin_bottom", 3),
-    )
-    margin_left = ConfigHelper.get_style_constant(
-        "contact_cell_margin_left",
-        ConfigHelper.get_style_constant("cell_margin_left", 3),
-    )
-    margin_right = ConfigHelper.get_style_constant(
-        "contact_cell_margin_right",
-        ConfigHelper.get_style_constant("cell_margin_right", 3),
-    )
-    _cell_margins(wrapper_cell, margin_top, margin_bottom, margin_left, margin_right)
+    _cell_margins(wrapper_cell, *_cell_type_margins("contact"))
 
     # Remove default paragraph in wrapper cell
     if wrapper_cell.paragraphs:
@@ -1387,11 +1574,8 @@ def _process_contact_info_ribbon_single_column(
     # --- Ribbon row ---
     cell = ribbon_table.cell(0, 0)
     _apply_table_cell_fill_and_border_styles(cell, contact_ribbon_styles)
-    # Remove the default empty paragraph in the cell to avoid a blank line
-    if cell.paragraphs:
-        p = cell.paragraphs[0]
-        p._element.getparent().remove(p._element)
-    para = cell.add_paragraph()
+    # Reuse the default empty paragraph in the cell to avoid a blank line
+    para = cell.paragraphs[0] if cell.paragraphs else cell.add_paragraph()
     _paragraph_alignment(para, "center")
     for i, item in enumerate(contact_items):
         if i > 0:
@@ -1406,14 +1590,15 @@ def _process_contact_info_ribbon_single_column(
             )
         strong_tag = item.find("strong")
         if strong_tag:
-            label_run = para.add_run(strong_tag.text.strip())
+            strong_text = strong_tag.text
+            label_run = para.add_run(strong_text.strip())
             _apply_font_properties(
                 label_run.font,
                 {
                     "bold": True,
                 },
             )
-            value_text = item.text.replace(strong_tag.text, "").strip()
+            value_text = item.text.replace(strong_text, "").strip()
             if value_text:
                 # Use the same hyperlink processing as two-column mode
                 _process_text_for_hyperlinks(para, f" {value_text}")
@@ -1432,14 +1617,8 @@ def convert_to_pdf(docx_file: Path) -> Path | None:
     """
     pdf_file = docx_file.with_suffix(f".{PDF_EXTENSION}")
 
-    # Try multiple conversion methods
-    methods = [
-        _convert_with_docx2pdf,
-        _convert_with_libreoffice,
-        _convert_with_win32com,
-    ]
-
-    for method in methods:
+    # Try the conversion methods whose tools are available
+    for method in _available_pdf_converters():
         try:
             if method(docx_file, pdf_file):
                 return Path(pdf_file)
@@ -1453,6 +1632,117 @@ def convert_to_pdf(docx_file: Path) -> Path | None:
     return None
 
 
+def convert_many(
+    md_files: list[Path],
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    config_file: Path = DEFAULT_CONFIG_FILE,
+    max_workers: int | None = None,
+    create_pdf: bool = False,
+    two_column: bool = False,
+) -> list[Path]:
+    """Convert several markdown resumes in parallel worker processes
+
+    Each resume is converted independently, so the files are spread over a
+    process pool (one worker per CPU by default). PDF versions are written next
+    to the Word documents.
+
+    Args:
+        md_files (list[Path]): Paths to the markdown resume files
+        output_dir (Path): Directory for the Word documents, named after each input
+        config_file (Path): Path to the YAML configuration file used for every resume
+        max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        create_pdf (bool, optional): Also create a PDF of each resume. Defaults to False.
+        two_column (bool, optional): Use the two-column layout. Defaults to False.
+
+    Returns:
+        list[Path]: Paths to the created documents, in the order of md_files
+
+    Raises:
+        ValueError: If two input files would be written to the same output file
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    output_dir = Path(output_dir)
+
+    # Workers get the config path rather than a ConfigLoader, which is cheaper to send
+    jobs = [
+        (
+            Path(md_file),
+            output_dir / Path(md_file).with_suffix(f".{DOCX_EXTENSION}").name,
+            str(config_file),
+            two_column,
+        )
+        for md_file in md_files
+    ]
+
+    # Inputs with the same name in different directories would overwrite each other
+    seen_outputs = {}
+    for md_file, output_file, _, _ in jobs:
+        if output_file in seen_outputs:
+            raise ValueError(
+                f"{seen_outputs[output_file]} and {md_file} would both be written "
+                f"to {output_file}"
+            )
+        seen_outputs[output_file] = md_file
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if len(jobs) <= 1:
+        results = [_convert_many_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_convert_many_job, jobs))
+
+    if create_pdf:
+        _convert_many_to_pdf(results)
+
+    return results
+
+
+def _convert_many_job(job: tuple[Path, Path, str, bool]) -> Path:
+    """Convert a single resume for convert_many in a worker process
+
+    Args:
+        job (tuple): (md_file, output_file, config_file, two_column)
+
+    Returns:
+        Path: Path to the created document
+    """
+    md_file, output_file, config_file, two_column = job
+    # The config is parsed once per worker process and reused for its other jobs
+    config_loader = get_config_loader(config_file, two_column=two_column)
+    return create_ats_resume(md_file, output_file, config_loader)
+
+
+def _convert_many_to_pdf(docx_files: list[Path]) -> None:
+    """Create a PDF next to each of several Word documents
+
+    LibreOffice conversions are run together when it is the preferred converter,
+    any file it fails on is retried with convert_to_pdf.
+
+    Args:
+        docx_files (list[Path]): Paths to the Word documents
+    """
+    converters = _available_pdf_converters()
+    if converters and converters[0] is _convert_with_libreoffice:
+        pairs = [
+            (str(docx_file), str(docx_file.with_suffix(f".{PDF_EXTENSION}")))
+            for docx_file in docx_files
+        ]
+        converted = _convert_batch_with_libreoffice(pairs)
+    else:
+        converted = [False] * len(docx_files)
+
+    for docx_file, done in zip(docx_files, converted):
+        pdf_file = (
+            docx_file.with_suffix(f".{PDF_EXTENSION}")
+            if done
+            else convert_to_pdf(docx_file)
+        )
+        if pdf_file:
+            print(f"✅ Created PDF: {pdf_file}")
+
+
 ##############################
 # Section Processors
 ##############################
@@ -1477,14 +1767,15 @@ def process_header_section(
     header_alignment = header_defaults.get("header_alignment", "center")
 
     # Always extract and add the main title (name) directly to the document
-    name = soup.find("h1").text
+    name_h1 = soup.find("h1")
+    name = name_h1.text
     title_para = document.add_paragraph(style="Title")
     # Always center the title regardless of header_alignment setting
     _paragraph_alignment(title_para, "center")
     title_para.add_run(name)
 
     # Extract the tagline (first paragraph after h1)
-    first_p = soup.find("h1").find_next_sibling()
+    first_p = name_h1.find_next_sibling()
     has_tagline = first_p and first_p.name == "p"
 
     # Create a table for the image and tagline only if image is enabled
@@ -1521,14 +1812,10 @@ def process_header_section(
         img_align_vertical = header_image.get("vertical_alignment", "center")
         _cell_vertical_alignment(img_cell, img_align_vertical)
 
-        # Clear any existing paragraph
-        if img_cell.paragraphs:
-            p = img_cell.paragraphs[0]
-            p._element.getparent().remove(p._element)
-            p._p = None
-            p._element = None
-
-        img_para = img_cell.add_paragraph()
+        # Reuse the cell's default empty paragraph for the image
+        img_para = (
+            img_cell.paragraphs[0] if img_cell.paragraphs else img_cell.add_paragraph()
+        )
 
         # Add image
         _url_image(
@@ -1583,12 +1870,9 @@ def process_about_section(
         None
     """
     about_section = ResumeSection.get_section("ABOUT")
-    add_space_before_h2 = about_section.add_space_before_h2
-    about_section.space_before_h2 if add_space_before_h2 else None
-    about_section.space_after_h2
 
     # Remove heading creation from _prepare_section for about section
-    section_h2 = soup.find("h2", string=lambda text: about_section.matches(text))
+    section_h2 = ResumeSection.find_heading(soup, about_section)
     if not section_h2:
         print(f"ℹ️  Section '{about_section.docx_heading}' not found in document")
         return
@@ -1607,25 +1891,13 @@ def process_about_section(
     # Only add heading in two_column mode, or if not already created by _prepare_section
     # _prepare_section already adds the heading, so do NOT add again in single-column mode
 
-    add_space_before_h3 = about_section.add_space_before_h3
-    space_before_h3 = about_section.space_before_h3 if add_space_before_h3 else None
-    space_after_h3 = about_section.space_after_h3
+    spacing = about_section.spacing
 
     if not section_h2:
         return  # Gracefully exit if section doesn't exist
 
-    current_element = section_h2.find_next_sibling()
-
-    # Initialize processed_elements set if we're in the About section
-    processed_elements = set()
-
     # Add all paragraphs until next h2
-    while current_element and current_element.name != "h2":
-        # Skip if already processed
-        if current_element in processed_elements:
-            current_element = current_element.find_next_sibling()
-            continue
-
+    for current_element in _section_elements(section_h2):
         # Check if this is a paragraph with strong element containing highlights
         highlights_subsection = None
         if (
@@ -1640,24 +1912,40 @@ def process_about_section(
             para = document.add_paragraph()
 
             # Process all elements of the paragraph to preserve formatting
+            pending_text = []
             for child in current_element.children:
+                # Collect plain text, contiguous pieces are added in a single pass
+                if isinstance(child, NavigableString):
+                    pending_text.append(child)
+                    continue
+
+                child_name = child.name
+                href = child.get("href") if child_name == "a" else None
+
+                # Other inline tags without formatting are added as plain text too
+                if child_name not in ("strong", "em") and not href:
+                    if child.string:
+                        pending_text.append(child.string)
+                    continue
+
+                if pending_text:
+                    _process_text_for_hyperlinks(para, "".join(pending_text))
+                    pending_text.clear()
+
                 # Check if this is a strong/bold element
-                if getattr(child, "name", None) == "strong":
+                if child_name == "strong":
                     run = para.add_run(child.text)
                     _apply_font_properties(run.font, {"bold": True})
                 # Check if this is an em/italic element
-                elif getattr(child, "name", None) == "em":
+                elif child_name == "em":
                     run = para.add_run(child.text)
                     _apply_font_properties(run.font, {"italic": True})
-                # Check if this is a link/anchor element
-                elif getattr(child, "name", None) == "a" and child.get("href"):
-                    _add_hyperlink(para, child.text, child.get("href"))
-                # Otherwise, just add the text as-is
+                # Otherwise this is a link/anchor element
                 else:
-                    if child.string:
-                        _process_text_for_hyperlinks(para, child.string)
+                    _add_hyperlink(para, child.text, href)
 
-            processed_elements.add(current_element)
+            if pending_text:
+                _process_text_for_hyperlinks(para, "".join(pending_text))
 
         # Handle highlights subsection found in a paragraph or heading
         elif highlights_subsection:
@@ -1672,17 +1960,13 @@ def process_about_section(
                 heading_level,
                 bold=highlights_subsection.bold,
                 italic=highlights_subsection.italic,
-                space_before=space_before_h3,
-                space_after=space_after_h3,
+                space_before=spacing.h3_before,
+                space_after=spacing.h3_after,
             )
-            processed_elements.add(current_element)
 
         # Handle bullet list
         elif current_element.name == "ul":
             _add_bullet_list(document, current_element)
-            processed_elements.add(current_element)
-
-        current_element = current_element.find_next_sibling()
 
 
 def process_skills_section(
@@ -1737,209 +2021,57 @@ def process_experience_section(
     if not section_h2:
         return  # Gracefully exit if section doesn't exist
 
-    # Find all job entries (h3 headings under Experience)
-    current_element = section_h2.find_next_sibling()
-    # Use a set of element IDs instead of element objects
-    processed_element_ids = set()
-    processed_elements = set()
-    add_space_before_h3 = experience_section.add_space_before_h3
-    space_before_h3 = (
-        experience_section.space_before_h3 if add_space_before_h3 else None
-    )
-    space_after_h3 = experience_section.space_after_h3
-
-    add_space_before_h4 = experience_section.add_space_before_h4
-    space_before_h4 = (
-        experience_section.space_before_h4 if add_space_before_h4 else None
-    )
-    space_after_h4 = experience_section.space_after_h4
+    # Collect the section's elements once, up to the next h2
+    siblings = list(_section_elements(section_h2))
+    # Positional bitmap of elements already consumed by a job, position or subsection
+    visited = bytearray(len(siblings))
+    spacing = experience_section.spacing
 
     # Track if this is the first job
     first_job = True
 
-    while current_element and current_element.name != "h2":
-        # Get unique ID for this element
-        element_id = id(current_element)
-
-        # Skip if already processed (except h3 elements)
-        if element_id in processed_element_ids and current_element.name != "h3":
-            current_element = current_element.find_next_sibling()
+    for idx, current_element in enumerate(siblings):
+        # Skip if already processed
+        if visited[idx]:
             continue
 
         # Process based on element type
         if current_element.name == "h3":
             # Process job entry and mark as processed
-            processed_elements = _process_job_entry(
+            _process_job_entry(
                 document,
-                current_element,
-                set(),
-                space_before_h3,
-                space_after_h3,
+                siblings,
+                idx,
+                visited,
+                spacing.h3_before,
+                spacing.h3_after,
                 is_first_job=first_job,
             )
-            processed_element_ids.add(element_id)
 
             if first_job:
                 first_job = False
 
-        elif current_element.name == "h4" and element_id not in processed_element_ids:
+        elif current_element.name == "h4":
             # Process position and mark as processed
-            processed_elements = _process_position(
-                document, current_element, set(), space_before_h4, space_after_h4
+            _process_position(
+                document, siblings, idx, visited, spacing.h4_before, spacing.h4_after
             )
-            processed_element_ids.add(element_id)
 
-        elif (
-            current_element.name in ["h5", "h6"]
-            and element_id not in processed_element_ids
-        ):
+        elif current_element.name in SUBSECTION_HEADING_TAGS:
             # Find matching subsection type
             subsection = JobSubsection.find_by_tag_and_text(
                 current_element.name, current_element.text
             )
 
-            if subsection:
+            processor = _JOB_SUBSECTION_PROCESSORS.get(subsection)
+            if processor:
                 heading_level = HeadingsHelper.get_level_for_tag(current_element.name)
-
-                # PROJECT/CLIENT requires special handling with its own function
-                if (
-                    subsection == JobSubsection.PROJECT_CLIENT
-                    and current_element not in processed_elements
-                ):
-                    project_processed = _process_project_section(
-                        document,
-                        current_element,
-                        processed_elements,
-                    )
-
-                    # Add all elements processed by the project handler to our tracking
-                    processed_elements.update(project_processed)
-
-                    # Also update element IDs
-                    for element in project_processed:
-                        processed_element_ids.add(id(element))
-
-                # Generic subsection processing for SUMMARY, INTERNAL, etc.
-                elif (
-                    subsection in [JobSubsection.SUMMARY, JobSubsection.INTERNAL]
-                    and current_element not in processed_elements
-                ):
-                    project_processed = _process_subsection(
-                        document,
-                        current_element,
-                        subsection,
-                        heading_level,
-                        processed_elements,
-                    )
-
-                    # Update tracking
-                    processed_elements.update(project_processed)
-                    for element in project_processed:
-                        processed_element_ids.add(id(element))
-
-                # KEY_SKILLS subsection
-                elif subsection == JobSubsection.KEY_SKILLS:
-                    key_skills_heading_line_spacing = ConfigHelper.get_style_constant(
-                        "key_skills_heading_line_spacing", None
-                    )
-                    skills_heading = _add_heading_or_paragraph(
-                        document,
-                        subsection.full_heading,
-                        heading_level,
-                        bold=subsection.bold,
-                        italic=subsection.italic,
-                    )
-
-                    # Set line spacing for the heading
-                    _apply_paragraph_format_properties(
-                        skills_heading.paragraph_format,
-                        {"line_spacing": key_skills_heading_line_spacing},
-                    )
-
-                    # Get skills from next element
-                    next_element = current_element.find_next_sibling()
-                    if next_element and next_element.name == "p":
-                        skills_para = _process_horizontal_skills_list(
-                            document, next_element.text, is_top_skills=False
-                        )
-                        processed_elements.add(next_element)
-
-                    # Determine if we need to add a blank line after Key Skills
-                    # We'll add a blank line if:
-                    # 1. There are no more headings (end of section)
-                    # 2. The next heading is an h3 (new job)
-                    # 3. The next heading is an h4 (new role within same company)
-                    # We won't add a blank line if there's an h5 or h6 after Key Skills
-                    looking_ahead = current_element
-                    next_heading = None
-
-                    # Look for the next heading element
-                    while looking_ahead and not next_heading:
-                        looking_ahead = looking_ahead.find_next_sibling()
-                        if looking_ahead and looking_ahead.name in [
-                            "h3",
-                            "h4",
-                            "h5",
-                            "h6",
-                        ]:
-                            next_heading = looking_ahead
-
-                    # Add space if this is the last role or before a new role (most likely h4)
-                    # TODO: can this be removed?
-                    # if not next_heading or next_heading.name in ["h4"]:
-                    #     _add_space_paragraph(document, 8)
-
-                # RESPONSIBILITIES subsection (standalone)
-                elif (
-                    subsection == JobSubsection.RESPONSIBILITIES
-                    and current_element not in processed_elements
-                ):
-                    _add_heading_or_paragraph(
-                        document,
-                        subsection.full_heading,
-                        heading_level,
-                        bold=subsection.bold,
-                        italic=subsection.italic,
-                    )
-
-                    # Get content
-                    next_element = current_element.find_next_sibling()
-                    if next_element:
-                        if next_element.name == "p":
-                            resp_para = document.add_paragraph()
-                            _process_text_for_hyperlinks(resp_para, next_element.text)
-                            processed_elements.add(next_element)
-                        elif next_element.name == "ul":
-                            # Process bullet list
-                            _add_bullet_list(document, next_element)
-                            processed_elements.add(next_element)
-
-                # ADDITIONAL_DETAILS subsection (standalone)
-                elif (
-                    subsection == JobSubsection.ADDITIONAL_DETAILS
-                    and current_element not in processed_elements
-                ):
-                    _add_heading_or_paragraph(
-                        document,
-                        subsection.full_heading,
-                        heading_level,
-                        bold=subsection.bold,
-                        italic=subsection.italic,
-                    )
-
-                    # Get content (next element might be list items)
-                    next_element = current_element.find_next_sibling()
-                    if next_element and next_element.name == "ul":
-                        _add_bullet_list(document, next_element)
-                        processed_elements.add(next_element)
+                processor(document, siblings, idx, subsection, heading_level, visited)
 
         # Standalone bullet points
-        elif current_element.name == "ul" and current_element not in processed_elements:
+        elif current_element.name == "ul":
             # Process bullet list
             _add_bullet_list(document, current_element)
-            processed_element_ids.add(element_id)
-
-        current_element = current_element.find_next_sibling()
 
 
 def process_education_section(
@@ -1995,25 +2127,14 @@ def process_certifications_section(
     if not section_h2:
         return  # Gracefully exit if section doesn't exist
 
-    add_space_before_h3 = certifications_section.add_space_before_h3
-    space_before_h3 = (
-        certifications_section.space_before_h3 if add_space_before_h3 else None
-    )
-    space_after_h3 = certifications_section.space_after_h3
-
-    add_space_before_h4 = certifications_section.add_space_before_h4
-    space_before_h4 = (
-        certifications_section.space_before_h4 if add_space_before_h4 else None
-    )
-    space_after_h4 = certifications_section.space_after_h4
-
+    spacing = certifications_section.spacing
     _process_projects_or_certifications(
         document,
         section_h2,
-        space_before_h3=space_before_h3,
-        space_after_h3=space_after_h3,
-        space_before_h4=space_before_h4,
-        space_after_h4=space_after_h4,
+        space_before_h3=spacing.h3_before,
+        space_after_h3=spacing.h3_after,
+        space_before_h4=spacing.h4_before,
+        space_after_h4=spacing.h4_after,
     )
 
 
@@ -2040,17 +2161,13 @@ def process_projects_section(
     if not section_h2:
         return  # Gracefully exit if section doesn't exist
 
-    add_space_before_h3 = projects_section.add_space_before_h3
-    space_before_h3 = projects_section.space_before_h3 if add_space_before_h3 else None
-    space_after_h3 = projects_section.space_after_h3
-    space_after_h4 = projects_section.space_after_h4
-
+    spacing = projects_section.spacing
     _process_projects_or_certifications(
         document,
         section_h2,
-        space_before_h3=space_before_h3,
-        space_after_h3=space_after_h3,
-        space_after_h4=space_after_h4,
+        space_before_h3=spacing.h3_before,
+        space_after_h3=spacing.h3_after,
+        space_after_h4=spacing.h4_after,
     )
 
 
@@ -2114,12 +2231,7 @@ def _create_table(
     for cell in table._cells:
         cell_xml = cell._tc
         tcPr = cell_xml.get_or_add_tcPr()
-        tcBorders = OxmlElement("w:tcBorders")
-        for border in ["top", "left", "bottom", "right"]:
-            border_elem = OxmlElement(f"w:{border}")
-            border_elem.set(qn("w:val"), "nil")
-            tcBorders.append(border_elem)
-        tcPr.append(tcBorders)
+        tcPr.append(copy.deepcopy(_NIL_CELL_BORDERS))
 
     return table
 
@@ -2144,8 +2256,9 @@ def _process_contact_info_horizontal(cell: DOCX_Cell, soup: BeautifulSoup) -> No
     # Set gray background for the cell
     _apply_table_cell_fill_and_border_styles(cell, contact_ribbon_styles)
 
-    # Find the contact section
-    contact_section = soup.find("h2", string=lambda text: text.lower() == "contact")
+    # Find the contact section (the h2 index is shared with the other sections)
+    section = ResumeSection.get_section("CONTACT")
+    contact_section = ResumeSection.find_heading(soup, section) if section else None
     if not contact_section:
         return
 
@@ -2154,13 +2267,9 @@ def _process_contact_info_horizontal(cell: DOCX_Cell, soup: BeautifulSoup) -> No
     _paragraph_alignment(para, "center")
 
     # Find all contact entries (paragraphs after h2 until next h2)
-    current_element = contact_section.find_next_sibling()
-    contact_items = []
-
-    while current_element and current_element.name != "h2":
-        if current_element.name == "p":
-            contact_items.append(current_element)
-        current_element = current_element.find_next_sibling()
+    contact_items = [
+        element for element in _section_elements(contact_section) if element.name == "p"
+    ]
 
     # Add contact items horizontally with separators
     for i, item in enumerate(contact_items):
@@ -2180,7 +2289,8 @@ def _process_contact_info_horizontal(cell: DOCX_Cell, soup: BeautifulSoup) -> No
         strong_tag = item.find("strong")
         if strong_tag:
             # Add the label in bold
-            label_run = para.add_run(strong_tag.text.strip())
+            strong_text = strong_tag.text
+            label_run = para.add_run(strong_text.strip())
             _apply_font_properties(
                 label_run.font,
                 {
@@ -2189,7 +2299,7 @@ def _process_contact_info_horizontal(cell: DOCX_Cell, soup: BeautifulSoup) -> No
             )
 
             # Add the value (rest of the text)
-            value_text = item.text.replace(strong_tag.text, "").lstrip()
+            value_text = item.text.replace(strong_text, "").lstrip()
             if value_text:
                 # Only add a space if value_text does not already start with one
                 if not value_text.startswith(" "):
@@ -2200,6 +2310,28 @@ def _process_contact_info_horizontal(cell: DOCX_Cell, soup: BeautifulSoup) -> No
             _process_text_for_hyperlinks(para, item.text.strip())
 
 
+@functools.lru_cache(maxsize=None)
+def _cell_type_margins(cell_type: str | None) -> tuple[int, int, int, int]:
+    """Read the margins for a type of cell from config
+
+    Each side falls back to the generic cell margin, then to 3 points. The result is
+    cached until ConfigHelper is initialized with a new configuration.
+
+    Args:
+        cell_type: Type of cell ('about', 'contact', 'sidebar', 'main')
+
+    Returns:
+        tuple: The top, bottom, left and right margins in points
+    """
+    return tuple(
+        ConfigHelper.get_style_constant(
+            f"{cell_type}_cell_margin_{side}",
+            ConfigHelper.get_style_constant(f"cell_margin_{side}", 3),
+        )
+        for side in ("top", "bottom", "left", "right")
+    )
+
+
 def _cell_margins(
     cell: DOCX_Cell,
     top: int = 3,
@@ -2223,7 +2355,6 @@ def _cell_margins(
     # Get the cell's XML element
     tc = cell._tc
     tcPr = tc.get_or_add_tcPr()
-    tcMar = OxmlElement("w:tcMar")
 
     # Add each margin side
     # Convert points to twips
@@ -2234,10 +2365,11 @@ def _cell_margins(
         "end": right * 20 if not twips else right,
     }
 
+    tcMar = OxmlElement("w:tcMar")
     for side, width in side_map.items():
         node = OxmlElement(f"w:{side}")
-        node.set(qn("w:w"), str(width))  # Value is in twips
-        node.set(qn("w:type"), "dxa")
+        node.set(QN_W_W, str(width))  # Value is in twips
+        node.set(QN_W_TYPE, "dxa")
         tcMar.append(node)
 
     tcPr.append(tcMar)
@@ -2264,18 +2396,14 @@ def _cell_vertical_alignment(
         tcPr = tc.get_or_add_tcPr()
 
         tcVAlign = OxmlElement("w:vAlign")
-        tcVAlign.set(qn("w:val"), vertical_alignment)
+        tcVAlign.set(QN_W_VAL, vertical_alignment)
         tcPr.append(tcVAlign)
     else:
         # Set vertical alignment
-        if vertical_alignment == "top":
-            cell.vertical_alignment = DOCX_CELL_ALIGN_VERTICAL.TOP
-        elif vertical_alignment == "center":
-            cell.vertical_alignment = DOCX_CELL_ALIGN_VERTICAL.CENTER
-        elif vertical_alignment == "bottom":
-            cell.vertical_alignment = DOCX_CELL_ALIGN_VERTICAL.BOTTOM
-        else:
+        alignment = _CELL_VERTICAL_ALIGNMENTS.get(vertical_alignment)
+        if alignment is None:
             raise ValueError(f"Invalid vertical alignment: {vertical_alignment}")
+        cell.vertical_alignment = alignment
 
 
 def _create_table_cell_subdocument(
@@ -2298,24 +2426,7 @@ def _create_table_cell_subdocument(
             p._p.getparent().remove(p._p)
 
     # Get margin values from config based on cell type
-    margin_top = ConfigHelper.get_style_constant(
-        f"{cell_type}_cell_margin_top",
-        ConfigHelper.get_style_constant("cell_margin_top", 3),
-    )
-    margin_bottom = ConfigHelper.get_style_constant(
-        f"{cell_type}_cell_margin_bottom",
-        ConfigHelper.get_style_constant("cell_margin_bottom", 3),
-    )
-    margin_left = ConfigHelper.get_style_constant(
-        f"{cell_type}_cell_margin_left",
-        ConfigHelper.get_style_constant("cell_margin_left", 3),
-    )
-    margin_right = ConfigHelper.get_style_constant(
-        f"{cell_type}_cell_margin_right",
-        ConfigHelper.get_style_constant("cell_margin_right", 3),
-    )
-
-    _cell_margins(cell, margin_top, margin_bottom, margin_left, margin_right)
+    _cell_margins(cell, *_cell_type_margins(cell_type))
 
     _cell_vertical_alignment(cell, v_align)
 
@@ -2339,8 +2450,8 @@ def _apply_table_cell_fill_and_border_styles(
 
     if fill_enabled:
         shading = OxmlElement("w:shd")
-        shading.set(qn("w:fill"), styles.get("fill_color", "FFFFFF"))
-        shading.set(qn("w:val"), "clear")
+        shading.set(QN_W_FILL, styles.get("fill_color", "FFFFFF"))
+        shading.set(QN_W_VAL, "clear")
         tcPr.append(shading)
 
     border_enabled = styles.get("border_enabled", False)
@@ -2352,41 +2463,16 @@ def _apply_table_cell_fill_and_border_styles(
         border_width = styles.get("border_width", 1)
         border_color = styles.get("border_color", "FFFFFF")
 
-        for border in ["top", "left", "bottom", "right"]:
-            if border == "top" and not styles.get("border_top_enabled", border_enabled):
-                continue
-            if border == "left" and not styles.get(
-                "border_left_enabled", border_enabled
-            ):
-                continue
-            if border == "bottom" and not styles.get(
-                "border_bottom_enabled", border_enabled
-            ):
-                continue
-            if border == "right" and not styles.get(
-                "border_right_enabled", border_enabled
-            ):
+        for border in ("top", "left", "bottom", "right"):
+            if not styles.get(f"border_{border}_enabled", border_enabled):
                 continue
+            # Each side falls back to the shared width and color on its own
+            side_width = styles.get(f"border_{border}_width", border_width)
+            side_color = styles.get(f"border_{border}_color", border_color)
             border_elem = OxmlElement(f"w:{border}")
-            border_elem.set(qn("w:val"), "single")  # 'single' for solid line
-            if border == "top":
-                border_width = styles.get("border_top_width", border_width)
-                border_color = styles.get("border_top_color", border_color)
-            elif border == "bottom":
-                border_width = styles.get("border_bottom_width", border_width)
-                border_color = styles.get("border_bottom_color", border_color)
-            elif border == "left":
-                border_width = styles.get("border_left_width", border_width)
-                border_color = styles.get("border_left_color", border_color)
-            elif border == "right":
-                border_width = styles.get("border_right_width", border_width)
-                border_color = styles.get("border_right_color", border_color)
-            else:
-                raise ValueError(f"Unknown border type: {border}")
-            border_elem.set(
-                qn("w:sz"), str(border_width * 8)
-            )  # Size in eighths of a point
-            border_elem.set(qn("w:color"), border_color)  # White border
+            border_elem.set(QN_W_VAL, "single")  # 'single' for solid line
+            border_elem.set(QN_W_SZ, str(side_width * 8))  # Size in eighths of a point
+            border_elem.set(QN_W_COLOR, side_color)
             tcBorders.append(border_elem)
 
         tcPr.append(tcBorders)
@@ -2401,28 +2487,24 @@ def _create_two_column_layout(document: DOCX_Document) -> tuple:
     Returns:
         tuple: (about_content_cell, contact_info_cell, sidebar_cell, main_cell)
     """
+    document_defaults = ConfigHelper.get_document_defaults()
+
     # Get page width excluding margins
-    page_width = ConfigHelper.get_document_defaults().get("page_width", 8.5)
-    margin_left = ConfigHelper.get_document_defaults().get("margin_left", 0.2)
-    margin_right = ConfigHelper.get_document_defaults().get("margin_right", 0.2)
+    page_width = document_defaults.get("page_width", 8.5)
+    margin_left = document_defaults.get("margin_left", 0.2)
+    margin_right = document_defaults.get("margin_right", 0.2)
     margins = margin_left + margin_right
     content_width = page_width - margins
 
-    sidebar_width_ratio = ConfigHelper.get_document_defaults().get(
-        "sidebar_width_ratio", 0.33
-    )
-    main_width_ratio = ConfigHelper.get_document_defaults().get(
-        "main_width_ratio", 0.67
-    )
+    sidebar_width_ratio = document_defaults.get("sidebar_width_ratio", 0.33)
+    main_width_ratio = document_defaults.get("main_width_ratio", 0.67)
 
     # Calculate column widths
     sidebar_width = content_width * sidebar_width_ratio
     main_width = content_width * main_width_ratio
 
     # Determine sidebar position (left or right)
-    sidebar_on_right = (
-        ConfigHelper.get_document_defaults().get("sidebar_position", "left") == "right"
-    )
+    sidebar_on_right = document_defaults.get("sidebar_position", "left") == "right"
 
     about_styles = ConfigHelper.get_style_constant("about", {})
 
@@ -2540,6 +2622,45 @@ def _add_horizontal_line_to_cell(cell: DOCX_Cell, is_sidebar: bool = False):
 ##############################
 # Primary Helpers
 ##############################
+@functools.lru_cache(maxsize=128)
+def _config_pt(points: float) -> Length:
+    """Convert a point size from config, the few distinct values are cached
+
+    Args:
+        points: Size in points
+
+    Returns:
+        Length: The size as a python-docx length
+    """
+    return Pt(points)
+
+
+@functools.lru_cache(maxsize=64)
+def _config_inches(inches: float) -> Length:
+    """Convert an inch measurement from config, the few distinct values are cached
+
+    Args:
+        inches: Measurement in inches
+
+    Returns:
+        Length: The measurement as a python-docx length
+    """
+    return Inches(inches)
+
+
+@functools.lru_cache(maxsize=64)
+def _config_rgb(color: str) -> RGBColor:
+    """Parse a hex color from config, the few distinct values are cached
+
+    Args:
+        color: Hex color string (e.g. '000000')
+
+    Returns:
+        RGBColor: The parsed color
+    """
+    return RGBColor.from_string(color)
+
+
 def _apply_font_properties(
     obj: DOCX_Run | DOCX_FONT, properties: Dict[str, str] = None
 ) -> None:
@@ -2559,36 +2680,19 @@ def _apply_font_properties(
     else:
         raise ValueError("obj must be a DOCX_Run or DOCX_FONT object")
 
+    # The run's font is resolved once above, run.font builds a new proxy on each access
     if "font_name" in properties:
-        if is_run_obj:
-            obj.font.name = properties["font_name"]
-        else:
-            font_obj.name = properties["font_name"]
+        font_obj.name = properties["font_name"]
     if "font_size" in properties:
-        if is_run_obj:
-            obj.font.size = Pt(properties["font_size"])
-        else:
-            font_obj.size = Pt(properties["font_size"])
+        font_obj.size = _config_pt(properties["font_size"])
     if "bold" in properties:
-        if is_run_obj:
-            obj.font.bold = properties["bold"]
-        else:
-            font_obj.bold = properties["bold"]
+        font_obj.bold = properties["bold"]
     if "italic" in properties:
-        if is_run_obj:
-            obj.font.italic = properties["italic"]
-        else:
-            font_obj.italic = properties["italic"]
+        font_obj.italic = properties["italic"]
     if "underline" in properties:
-        if is_run_obj:
-            obj.font.underline = properties["underline"]
-        else:
-            font_obj.underline = properties["underline"]
+        font_obj.underline = properties["underline"]
     if "color" in properties:
-        if is_run_obj:
-            obj.font.color.rgb = RGBColor.from_string(properties["color"])
-        else:
-            font_obj.color.rgb = RGBColor.from_string(properties["color"])
+        font_obj.color.rgb = _config_rgb(properties["color"])
 
 
 def _apply_paragraph_format_properties(
@@ -2603,13 +2707,13 @@ def _apply_paragraph_format_properties(
     if "line_spacing" in properties and properties["line_spacing"] is not None:
         paragraph_format.line_spacing = properties["line_spacing"]
     if "space_before" in properties and properties["space_before"] is not None:
-        paragraph_format.space_before = Pt(properties["space_before"])
+        paragraph_format.space_before = _config_pt(properties["space_before"])
     if "space_after" in properties and properties["space_after"] is not None:
-        paragraph_format.space_after = Pt(properties["space_after"])
+        paragraph_format.space_after = _config_pt(properties["space_after"])
     if "indent_left" in properties and properties["indent_left"] is not None:
-        paragraph_format.left_indent = Inches(properties["indent_left"])
+        paragraph_format.left_indent = _config_inches(properties["indent_left"])
     if "indent_right" in properties and properties["indent_right"] is not None:
-        paragraph_format.right_indent = Inches(properties["indent_right"])
+        paragraph_format.right_indent = _config_inches(properties["indent_right"])
     if "alignment" in properties and properties["alignment"] is not None:
         paragraph_format.alignment = properties["alignment"]
 
@@ -2631,7 +2735,7 @@ def _prepare_section(
     Returns:
         BeautifulSoup element or None: The section heading element if found, None otherwise
     """
-    section_h2 = soup.find("h2", string=lambda text: section_type.matches(text))
+    section_h2 = ResumeSection.find_heading(soup, section_type)
 
     if not section_h2:
         print(f"ℹ️  Section '{section_type.docx_heading}' not found in document")
@@ -2650,8 +2754,8 @@ def _prepare_section(
     # Add page break if HR is found
     if section_page_break:
         # Get the last paragraph in the document
-        if document.paragraphs:
-            last_para = document.paragraphs[-1]
+        last_para = _last_paragraph(document)
+        if last_para is not None:
             # Add page break to the LAST paragraph instead of creating a new one
             if last_para.runs:
                 last_run = last_para.runs[-1]
@@ -2678,6 +2782,69 @@ def _prepare_section(
     return section_h2
 
 
+_SkillsConfig = namedtuple(
+    "_SkillsConfig",
+    "input_separator output_separator bold font_size line_spacing use_formatted_paragraph"
+    " heading_line_spacing",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _skills_config(is_top_skills: bool) -> _SkillsConfig:
+    """Read the skills list settings for top skills or key skills from config
+
+    The result is cached until ConfigHelper is initialized with a new configuration.
+
+    Args:
+        is_top_skills: Whether to read the top skills settings (key skills otherwise)
+
+    Returns:
+        _SkillsConfig: The separators and formatting options for the skills list
+    """
+    if is_top_skills:
+        config_prefix = "top_skills"
+        default_input_sep = " • "
+        default_output_sep = " | "
+        use_formatted_paragraph = True
+    else:
+        config_prefix = "key_skills"
+        default_input_sep = " · "
+        default_output_sep = ", "
+        use_formatted_paragraph = False
+
+    return _SkillsConfig(
+        input_separator=ConfigHelper.get_style_constant(
+            f"{config_prefix}_separator_markdown", default_input_sep
+        ),
+        output_separator=ConfigHelper.get_style_constant(
+            f"{config_prefix}_separator", default_output_sep
+        ),
+        bold=ConfigHelper.get_style_constant(f"{config_prefix}_bold", False),
+        # Font size and line spacing (key skills specific)
+        font_size=ConfigHelper.get_style_constant(f"{config_prefix}_font_size", None),
+        line_spacing=ConfigHelper.get_style_constant(
+            f"{config_prefix}_line_spacing", None
+        ),
+        use_formatted_paragraph=use_formatted_paragraph,
+        heading_line_spacing=ConfigHelper.get_style_constant(
+            f"{config_prefix}_heading_line_spacing", None
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _skills_split_pattern(separator: str) -> re.Pattern:
+    """Compile a pattern that splits on a skills separator and its surrounding whitespace
+
+    Args:
+        separator: The skills separator used in the markdown
+
+    Returns:
+        re.Pattern: The compiled split pattern
+    """
+    return re.compile(rf"\s*{re.escape(separator.strip())}\s*")
+
+
 def _process_horizontal_skills_list(
     document: DOCX_Document,
     text: str,
@@ -2698,36 +2865,24 @@ def _process_horizontal_skills_list(
         DOCX_Paragraph: The created paragraph
     """
     # Get configuration based on skills type
-    if is_top_skills:
-        config_prefix = "top_skills"
-        default_input_sep = " • "
-        default_output_sep = " | "
-        use_formatted_paragraph = True
-    else:
-        config_prefix = "key_skills"
-        default_input_sep = " · "
-        default_output_sep = ", "
-        use_formatted_paragraph = False
-
-    # Get separators and formatting options
-    input_separator = custom_input_separator or ConfigHelper.get_style_constant(
-        f"{config_prefix}_separator_markdown", default_input_sep
-    )
-    output_separator = custom_output_separator or ConfigHelper.get_style_constant(
-        f"{config_prefix}_separator", default_output_sep
-    )
-    apply_bold = ConfigHelper.get_style_constant(f"{config_prefix}_bold", False)
-
-    # Get font size and line spacing (key skills specific)
-    font_size = ConfigHelper.get_style_constant(f"{config_prefix}_font_size", None)
-
-    line_spacing = ConfigHelper.get_style_constant(
-        f"{config_prefix}_line_spacing", None
-    )
+    (
+        input_separator,
+        output_separator,
+        apply_bold,
+        font_size,
+        line_spacing,
+        use_formatted_paragraph,
+        _heading_line_spacing,  # Only used for the key skills subsection heading
+    ) = _skills_config(is_top_skills)
+
+    # Apply separator overrides
+    input_separator = custom_input_separator or input_separator
+    output_separator = custom_output_separator or output_separator
 
     # Parse skills from text
-    skills = [s.strip() for s in text.split(input_separator.strip())]
-    skills = [s for s in skills if s]
+    skills = [
+        s for s in _skills_split_pattern(input_separator).split(text.strip()) if s
+    ]
 
     # Format and add to document
     paragraph = _format_skills_list(
@@ -2765,7 +2920,8 @@ def _process_tagline_and_specialty(
     em_tag = first_p.find("em")
     use_paragraph_style = False
     if em_tag:
-        tagline_para = container.add_paragraph(em_tag.text, style="Subtitle")
+        em_text = em_tag.text
+        tagline_para = container.add_paragraph(em_text, style="Subtitle")
         for run in tagline_para.runs:
             _apply_font_properties(
                 run.font,
@@ -2777,7 +2933,7 @@ def _process_tagline_and_specialty(
         _paragraph_alignment(tagline_para, alignment_str)
 
         # Add the rest of the paragraph if any
-        rest_of_p = first_p.text.replace(em_tag.text, "").strip()
+        rest_of_p = first_p.text.replace(em_text, "").strip()
         if rest_of_p:
             rest_para = container.add_paragraph()
             _paragraph_alignment(rest_para, alignment_str)
@@ -2839,67 +2995,97 @@ def _process_simple_section(
     if not section_h2:
         return
 
-    current_element = section_h2.find_next_sibling()
-
-    while current_element and current_element.name != "h2":
+    for current_element in _section_elements(section_h2):
         if current_element.name == "p":
             para = document.add_paragraph()
+            # Contiguous plain text pieces are added as a single run
+            pending_text = []
             for child in current_element.children:
                 if getattr(child, "name", None) == "strong":
+                    if pending_text:
+                        para.add_run("".join(pending_text))
+                        pending_text.clear()
                     run = para.add_run(f"{child.text}: ")
                     _apply_font_properties(run.font, {"bold": True})
-                else:
-                    if child.string and child.string.strip():
-                        _process_text_for_hyperlinks(para, child.string.strip())
+                    continue
+
+                text = child.string.strip() if child.string else ""
+                if not text:
+                    continue
+                if not _may_contain_link(text):
+                    pending_text.append(text)
+                    continue
+
+                # Links are only detected within a single piece, as before
+                if pending_text:
+                    para.add_run("".join(pending_text))
+                    pending_text.clear()
+                _process_text_for_hyperlinks(para, text)
+
+            if pending_text:
+                para.add_run("".join(pending_text))
         elif current_element.name == "ul":
             # Handle bullet lists if they appear
             _add_bullet_list(document, current_element)
 
-        current_element = current_element.find_next_sibling()
-
     # Add an extra space after the section if requested
     if add_space:
-        _add_space_paragraph(document, ConfigHelper.get_style_constant("font_size_pts"))
+        _add_space_paragraph(document)
+
+
+def _sibling_at(siblings: list[BS4_Element], idx: int) -> BS4_Element | None:
+    """Get the sibling at a position, or None past the end of the section
+
+    Args:
+        siblings: Elements of the section, in document order
+        idx: Position of the element
+
+    Returns:
+        BS4_Element | None: The element, or None if out of range
+    """
+    return siblings[idx] if idx < len(siblings) else None
 
 
 def _process_project_section(
     document: DOCX_Document,
-    project_element: BS4_Element,
-    processed_elements: set[BS4_Element],
-) -> set[BS4_Element]:
+    siblings: list[BS4_Element],
+    idx: int,
+    subsection: JobSubsection,
+    heading_level: int,
+    visited: bytearray,
+) -> None:
     """Process a project/client section and its related elements
 
     Args:
         document: The Word document object
-        project_element: BeautifulSoup element for the project heading
-        processed_elements: Set of elements already processed
+        siblings: Elements of the section, in document order
+        idx: Position of the project heading in siblings
+        subsection: The JobSubsection enum value
+        heading_level: The heading level from HeadingsHelper
+        visited: Bitmap of sibling positions already processed, updated in place
 
     Returns:
-        set: Updated set of processed elements
+        None
     """
+    project_element = siblings[idx]
     bullet_indent_inches = ConfigHelper.get_style_constant("bullet_indent_inches")
     project_client_indent_inches = ConfigHelper.get_style_constant(
         "project_client_indent_inches", bullet_indent_inches / 2
     )
+    # Convert once, the same indent is applied to every paragraph in the project
+    project_client_indent = Inches(project_client_indent_inches)
 
     # Get the next element to see if it contains the project details
-    next_element = project_element.find_next_sibling()
+    next_idx = idx + 1
+    next_element = _sibling_at(siblings, next_idx)
     project_info = ""
 
     # If next element is a paragraph, it might contain the project name/duration
     if next_element and next_element.name == "p":
         project_info = next_element.text.strip()
-        processed_elements.add(next_element)
-        next_element = next_element.find_next_sibling()
-
-    # Get the proper subsection
-    subsection = JobSubsection.find_by_tag_and_text(
-        project_element.name, project_element.text
-    )
-    if not subsection:
-        subsection = JobSubsection.PROJECT_CLIENT  # Fallback
-
-    heading_level = HeadingsHelper.get_level_for_tag(project_element.name)
+        visited[next_idx] = 1
+        next_idx += 1
+        next_element = _sibling_at(siblings, next_idx)
 
     # Prepare the project text
     project_text = subsection.full_heading
@@ -2916,18 +3102,15 @@ def _process_project_section(
     )
 
     # Process next elements under this project until another section
-    while (
-        next_element
-        and next_element.name not in ["h2", "h3", "h4"]
-        and not (next_element.name == "h5")
-    ):
+    while next_element and next_element.name not in PROJECT_STOP_TAGS:
         if next_element.name == "p" and not next_element.find("h6"):
             # Process regular paragraph text
             para = document.add_paragraph()
             _process_text_for_hyperlinks(para, next_element.text.strip())
-            _left_indent_paragraph(para, project_client_indent_inches)
-            processed_elements.add(next_element)
-            next_element = next_element.find_next_sibling()
+            _left_indent_paragraph(para, project_client_indent)
+            visited[next_idx] = 1
+            next_idx += 1
+            next_element = _sibling_at(siblings, next_idx)
             continue
 
         # Find subsection for h6 elements
@@ -2950,18 +3133,18 @@ def _process_project_section(
                 italic=h6_subsection.italic,
             )
             _left_indent_paragraph(
-                resp_heading, project_client_indent_inches
+                resp_heading, project_client_indent
             )  # Keep indentation
 
             # Get the paragraph with responsibilities
-            resp_element = next_element.find_next_sibling()
+            resp_element = _sibling_at(siblings, next_idx + 1)
             if resp_element and resp_element.name == "p":
                 resp_para = document.add_paragraph()
                 _process_text_for_hyperlinks(resp_para, resp_element.text)
                 _left_indent_paragraph(resp_para)
-                processed_elements.add(resp_element)
+                visited[next_idx + 1] = 1
 
-            processed_elements.add(next_element)
+            visited[next_idx] = 1
 
         # Additional Details
         elif h6_subsection == JobSubsection.ADDITIONAL_DETAILS:
@@ -2976,39 +3159,41 @@ def _process_project_section(
                 italic=h6_subsection.italic,
             )
             _left_indent_paragraph(
-                details_heading, project_client_indent_inches
+                details_heading, project_client_indent
             )  # Keep indentation
 
-            processed_elements.add(next_element)
+            visited[next_idx] = 1
 
         # Bullet points
         elif next_element.name == "ul":
-            _add_bullet_list(document, next_element, project_client_indent_inches)
-            processed_elements.add(next_element)
+            _add_bullet_list(document, next_element, project_client_indent)
+            visited[next_idx] = 1
 
-        next_element = next_element.find_next_sibling()
-
-    return processed_elements
+        next_idx += 1
+        next_element = _sibling_at(siblings, next_idx)
 
 
 def _process_job_entry(
     document: DOCX_Document,
-    job_element: BS4_Element,
-    processed_elements: set[BS4_Element],
+    siblings: list[BS4_Element],
+    idx: int,
+    visited: bytearray,
     space_before: int | None = None,
     space_after: int | None = None,
     is_first_job: bool = True,
-) -> set[BS4_Element]:
+) -> None:
     """Process a job entry (h3) and its related elements
 
     Args:
         document: The Word document object
-        job_element: BeautifulSoup element for the job heading
-        processed_elements: Set of elements already processed
+        siblings: Elements of the section, in document order
+        idx: Position of the job heading in siblings
+        visited: Bitmap of sibling positions already processed, updated in place
         space_before: Space before the job entry, if any
         space_after: Space after the job entry, if any
         is_first_job: Whether this is the first job entry in the document
     """
+    job_element = siblings[idx]
     job_title = job_element.text.strip()
 
     # Check for HR before h3 and add page break if found
@@ -3074,10 +3259,10 @@ def _process_job_entry(
     )
 
     # Mark the h3 as processed
-    processed_elements.add(job_element)
+    visited[idx] = 1
 
     # Check for the paragraph immediately after h3
-    next_element = job_element.find_next_sibling()
+    next_element = _sibling_at(siblings, idx + 1)
 
     # Process paragraph with duration text if it exists
     if next_element and next_element.name == "p":
@@ -3098,33 +3283,33 @@ def _process_job_entry(
 
         _apply_font_properties(duration_run.font, duration_settings)
 
-        processed_elements.add(next_element)
-
-    return processed_elements
+        visited[idx + 1] = 1
 
 
 def _process_subsection(
     document: DOCX_Document,
-    current_element: BS4_Element,
+    siblings: list[BS4_Element],
+    idx: int,
     subsection: JobSubsection,
     heading_level: int,
-    processed_elements: set[BS4_Element],
-) -> set[BS4_Element]:
+    visited: bytearray,
+) -> None:
     """Generic function to process any subsection (Summary, Internal, Responsibilities, etc.)
 
     Args:
         document: The Word document object
-        current_element: The subsection heading element
+        siblings: Elements of the section, in document order
+        idx: Position of the subsection heading in siblings
         subsection: The JobSubsection enum value
         heading_level: The heading level from HeadingsHelper
-        processed_elements: Set of elements already processed
+        visited: Bitmap of sibling positions already processed, updated in place
 
     Returns:
-        Updated set of processed elements
+        None
     """
-    if current_element not in processed_elements:
+    if not visited[idx]:
 
-        processed_elements.add(current_element)
+        visited[idx] = 1
 
         # Add the subsection heading
         _add_heading_or_paragraph(
@@ -3136,42 +3321,163 @@ def _process_subsection(
         )
 
         # Process elements under this subsection until we hit another heading
-        next_element = current_element.find_next_sibling()
-        stop_tags = ["h2", "h3", "h4", "h5", "h6"]
-
-        while next_element and next_element.name not in stop_tags:
+        for next_idx in range(idx + 1, len(siblings)):
+            next_element = siblings[next_idx]
+            if next_element.name in SUBSECTION_STOP_TAGS:
+                break
             if next_element.name == "p":
                 para = document.add_paragraph()
                 _process_text_for_hyperlinks(para, next_element.text.strip())
-                processed_elements.add(next_element)
+                visited[next_idx] = 1
             elif next_element.name == "ul":
                 _add_bullet_list(document, next_element)
-                processed_elements.add(next_element)
+                visited[next_idx] = 1
+
+
+def _process_key_skills_subsection(
+    document: DOCX_Document,
+    siblings: list[BS4_Element],
+    idx: int,
+    subsection: JobSubsection,
+    heading_level: int,
+    visited: bytearray,
+) -> None:
+    """Process a Key Skills subsection and the skills paragraph after it
+
+    Args:
+        document: The Word document object
+        siblings: Elements of the section, in document order
+        idx: Position of the subsection heading in siblings
+        subsection: The JobSubsection enum value
+        heading_level: The heading level from HeadingsHelper
+        visited: Bitmap of sibling positions already processed, updated in place
+
+    Returns:
+        None
+    """
+    skills_heading = _add_heading_or_paragraph(
+        document,
+        subsection.full_heading,
+        heading_level,
+        bold=subsection.bold,
+        italic=subsection.italic,
+    )
 
-            next_element = next_element.find_next_sibling()
+    # Set line spacing for the heading
+    _apply_paragraph_format_properties(
+        skills_heading.paragraph_format,
+        {"line_spacing": _skills_config(False).heading_line_spacing},
+    )
+
+    # Get skills from next element
+    next_element = _sibling_at(siblings, idx + 1)
+    if next_element and next_element.name == "p":
+        _process_horizontal_skills_list(
+            document, next_element.text, is_top_skills=False
+        )
+        visited[idx + 1] = 1
 
-    return processed_elements
+
+def _process_responsibilities_subsection(
+    document: DOCX_Document,
+    siblings: list[BS4_Element],
+    idx: int,
+    subsection: JobSubsection,
+    heading_level: int,
+    visited: bytearray,
+) -> None:
+    """Process a standalone Responsibilities subsection and its content
+
+    Args:
+        document: The Word document object
+        siblings: Elements of the section, in document order
+        idx: Position of the subsection heading in siblings
+        subsection: The JobSubsection enum value
+        heading_level: The heading level from HeadingsHelper
+        visited: Bitmap of sibling positions already processed, updated in place
+
+    Returns:
+        None
+    """
+    _add_heading_or_paragraph(
+        document,
+        subsection.full_heading,
+        heading_level,
+        bold=subsection.bold,
+        italic=subsection.italic,
+    )
+
+    # Get content
+    next_element = _sibling_at(siblings, idx + 1)
+    if next_element:
+        if next_element.name == "p":
+            resp_para = document.add_paragraph()
+            _process_text_for_hyperlinks(resp_para, next_element.text)
+            visited[idx + 1] = 1
+        elif next_element.name == "ul":
+            # Process bullet list
+            _add_bullet_list(document, next_element)
+            visited[idx + 1] = 1
+
+
+def _process_additional_details_subsection(
+    document: DOCX_Document,
+    siblings: list[BS4_Element],
+    idx: int,
+    subsection: JobSubsection,
+    heading_level: int,
+    visited: bytearray,
+) -> None:
+    """Process a standalone Additional Details subsection and its bullet list
+
+    Args:
+        document: The Word document object
+        siblings: Elements of the section, in document order
+        idx: Position of the subsection heading in siblings
+        subsection: The JobSubsection enum value
+        heading_level: The heading level from HeadingsHelper
+        visited: Bitmap of sibling positions already processed, updated in place
+
+    Returns:
+        None
+    """
+    _add_heading_or_paragraph(
+        document,
+        subsection.full_heading,
+        heading_level,
+        bold=subsection.bold,
+        italic=subsection.italic,
+    )
+
+    # Get content (next element might be list items)
+    next_element = _sibling_at(siblings, idx + 1)
+    if next_element and next_element.name == "ul":
+        _add_bullet_list(document, next_element)
+        visited[idx + 1] = 1
 
 
 def _process_position(
     document: DOCX_Document,
-    element: BS4_Element,
-    processed_elements: set[BS4_Element],
+    siblings: list[BS4_Element],
+    idx: int,
+    visited: bytearray,
     space_before: int | None = None,
     space_after: int | None = None,
-) -> set[BS4_Element]:
+) -> None:
     """Process a position entry (h4) and its related elements
 
     Args:
         document: The Word document object
-        job: BeautifulSoup element
-        processed_elements: Set of elements already processed
+        siblings: Elements of the section, in document order
+        idx: Position of the position heading in siblings
+        visited: Bitmap of sibling positions already processed, updated in place
         space_before: Whether to add space before h4 headings
         space_after: Space after h4 heading, if any
 
     Returns:
-        Updated set of processed elements
+        None
     """
+    element = siblings[idx]
     position_title = element.text.strip()
 
     # Add the position heading
@@ -3193,25 +3499,26 @@ def _process_position(
         },
     )
 
-    processed_elements.add(element)
-    next_element = element.find_next_sibling()
+    visited[idx] = 1
+    next_element = _sibling_at(siblings, idx + 1)
 
     # Process date and location elements (either h6 or p format)
     if next_element:
         # Handle paragraph date/location format
         # Handle paragraph with combined date and location on single line
         if next_element.name == "p":
-            if next_element.find("strong") or next_element.find("em"):
+            # Look up the formatting tags once, they also decide the run formatting
+            date_has_strong = next_element.find("strong") is not None
+            date_has_em = next_element.find("em") is not None
+            if date_has_strong or date_has_em:
 
                 # Check if next paragraph is location
-                next_next_element = next_element.find_next_sibling()
-                if (
-                    next_next_element
-                    and next_next_element.name == "p"
-                    and (
-                        next_next_element.find("strong") or next_next_element.find("em")
-                    )
-                ):
+                next_next_element = _sibling_at(siblings, idx + 2)
+                location_has_strong = location_has_em = False
+                if next_next_element and next_next_element.name == "p":
+                    location_has_strong = next_next_element.find("strong") is not None
+                    location_has_em = next_next_element.find("em") is not None
+                if location_has_strong or location_has_em:
                     # Create a single paragraph with both date and location
                     date_text = (
                         next_element.text.replace("*", "").replace("_", "").strip()
@@ -3249,8 +3556,8 @@ def _process_position(
                     _apply_font_properties(
                         date_run.font,
                         {
-                            "bold": next_element.find("strong") is not None,
-                            "italic": next_element.find("em") is not None,
+                            "bold": date_has_strong,
+                            "italic": date_has_em,
                             "font_size": date_loc_font_size,
                         },
                     )
@@ -3261,17 +3568,26 @@ def _process_position(
                     _apply_font_properties(
                         location_run.font,
                         {
-                            "bold": next_next_element.find("strong") is not None,
-                            "italic": next_next_element.find("em") is not None,
+                            "bold": location_has_strong,
+                            "italic": location_has_em,
                             "font_size": date_loc_font_size,
                         },
                     )
 
-                    processed_elements.add(next_element)
-                    processed_elements.add(next_next_element)
-                    next_element = next_next_element.find_next_sibling()
+                    visited[idx + 1] = 1
+                    visited[idx + 2] = 1
+
 
-    return processed_elements
+# Experience subsection processors, all called with
+# (document, siblings, idx, subsection, heading_level, visited)
+_JOB_SUBSECTION_PROCESSORS = {
+    JobSubsection.PROJECT_CLIENT: _process_project_section,
+    JobSubsection.SUMMARY: _process_subsection,
+    JobSubsection.INTERNAL: _process_subsection,
+    JobSubsection.KEY_SKILLS: _process_key_skills_subsection,
+    JobSubsection.RESPONSIBILITIES: _process_responsibilities_subsection,
+    JobSubsection.ADDITIONAL_DETAILS: _process_additional_details_subsection,
+}
 
 
 def _add_heading_or_paragraph(
@@ -3298,45 +3614,76 @@ def _add_heading_or_paragraph(
         The created heading or paragraph object
     """
     has_add_heading = hasattr(document, "add_heading")
-    format_styles = {}
 
     if not has_add_heading:
         # For cells or when paragraph style is requested, use add_paragraph
         para = document.add_paragraph()
         run = para.add_run(text)
-        format_styles["bold"] = bold
-        format_styles["italic"] = italic
 
         # Apply appropriate font size
         if font_size is None:
-            size_pt = HeadingsHelper.get_font_size_for_level(heading_level)
-            format_styles["font_size"] = size_pt
-        else:
-            format_styles["font_size"] = font_size
+            font_size = HeadingsHelper.get_font_size_for_level(heading_level)
 
-        _apply_font_properties(run.font, format_styles)
+        # Copy prebuilt run properties instead of setting each font property
+        run._r.insert(
+            0, copy.deepcopy(_run_properties_template(bold, italic, font_size))
+        )
     else:
         # Only use add_heading when available (for Document objects)
         para = document.add_heading(text, level=heading_level)
 
-    _add_space_before_or_after(
-        para,
-        space_before,
-        space_after,
-    )
+    # Most headings are added without explicit spacing
+    if space_before or space_after:
+        _add_space_before_or_after(
+            para,
+            space_before,
+            space_after,
+        )
 
     return para
 
 
+def _run_properties_template(
+    bold: bool, italic: bool, font_size: int | float
+) -> docx.oxml.shared.OxmlElement:
+    """Get a prebuilt ``w:rPr`` element for a bold/italic/font size combination
+
+    The element is built once per combination and cached, callers must insert a
+    copy of it into their run.
+
+    Args:
+        bold (bool): Whether the run is bold
+        italic (bool): Whether the run is italic
+        font_size (int | float): Font size in points
+
+    Returns:
+        OxmlElement: The cached run properties element
+    """
+    key = (bold, italic, font_size)
+    rPr = _RUN_PROPERTIES_TEMPLATES.get(key)
+    if rPr is None:
+        template_run = DOCX_Run(OxmlElement("w:r"), None)
+        _apply_font_properties(
+            template_run.font,
+            {"bold": bold, "italic": italic, "font_size": font_size},
+        )
+        rPr = template_run._r.rPr
+        _RUN_PROPERTIES_TEMPLATES[key] = rPr
+    return rPr
+
+
 def _add_bullet_list(
-    document: DOCX_Document, ul_element: BS4_Element, indentation: float = None
+    document: DOCX_Document,
+    ul_element: BS4_Element,
+    indentation: float | Length = None,
 ) -> DOCX_Paragraph:
     """Add bullet points from an unordered list element
 
     Args:
         document: The Word document object
         ul_element: BeautifulSoup element containing the unordered list
-        indentation (float, optional): Left indentation in inches
+        indentation (float | Length, optional): Left indentation in inches, or a
+                                                precomputed Length
 
     Returns:
         paragraph: The last bullet paragraph added
@@ -3368,25 +3715,31 @@ def _add_bullet_list(
     else:
         # Standard bullet list processing - unchanged
         bullet_para = None
+        if indentation and not isinstance(indentation, Length):
+            indentation = Inches(indentation)
+        # Resolve the style once, looking it up by name searches all document styles
+        bullet_style = document.part.styles["List Bullet"]
+        # Paragraph properties of the first bullet, copied into the following ones
+        bullet_pPr = None
         for li in ul_element.find_all("li"):
-            bullet_para = document.add_paragraph(style="List Bullet")
+            if bullet_pPr is None:
+                bullet_para = document.add_paragraph(style=bullet_style)
+                if indentation:
+                    _left_indent_paragraph(bullet_para, indentation)
+                bullet_pPr = bullet_para._p.get_or_add_pPr()
+            else:
+                bullet_para = document.add_paragraph()
+                bullet_para._p.insert(0, copy.deepcopy(bullet_pPr))
 
             # Process formatting using the helper function
             _process_list_item_formatting(bullet_para, li)
 
             # Ensure sentence ending for each bullet
             last_run = bullet_para.runs[-1] if bullet_para.runs else None
-            if last_run and not last_run.text.rstrip()[-1:] in [
-                ".",
-                "!",
-                "?",
-                ":",
-                ";",
-            ]:
-                last_run.text = last_run.text.rstrip() + "."
-
-            if indentation:
-                _left_indent_paragraph(bullet_para, indentation)
+            if last_run:
+                last_text = last_run.text.rstrip()
+                if last_text[-1:] not in SENTENCE_ENDINGS:
+                    last_run.text = last_text + "."
 
         return bullet_para
 
@@ -3412,7 +3765,7 @@ def _prepare_section_with_page_break(
     Returns:
         BeautifulSoup element or None: The section heading element if found, None otherwise
     """
-    section_h2 = soup.find("h2", string=lambda text: section_type.matches(text))
+    section_h2 = ResumeSection.find_heading(soup, section_type)
 
     if not section_h2:
         print(f"ℹ️  Section '{section_type.docx_heading}' not found in document")
@@ -3448,9 +3801,7 @@ def _prepare_section_with_page_break(
         # Check if there's an HR before this section
         if _has_hr_before_element(section_h2):
             # Check if document has any content already (for cells or documents)
-            has_content = False
-            if hasattr(document, "paragraphs"):
-                has_content = len(document.paragraphs) > 0
+            has_content = _last_paragraph(document) is not None
 
             if has_content:
                 # Add page break before this section
@@ -3489,10 +3840,10 @@ def _process_projects_or_certifications(
     if not section_h2:
         return
 
-    current_element = section_h2.find_next_sibling()
+    siblings = list(_section_elements(section_h2))
     first_h3_after_h2 = True  # Track the first h3 after h2
 
-    while current_element and current_element.name != "h2":
+    for idx, current_element in enumerate(siblings):
         # Process certification name (h3)
         if current_element.name == "h3":
             cert_name = current_element.text.strip()
@@ -3521,7 +3872,8 @@ def _process_projects_or_certifications(
             )
 
             # Look for next elements - either blockquote or organization info directly
-            next_element = current_element.find_next_sibling()
+            next_idx = idx + 1
+            next_element = _sibling_at(siblings, next_idx)
 
             # Process any paragraph text that comes after h3 but before blockquote
             while next_element and next_element.name == "p":
@@ -3530,7 +3882,8 @@ def _process_projects_or_certifications(
                 _process_text_for_hyperlinks(para, next_element.get_text().strip())
 
                 # Move to the next element
-                next_element = next_element.find_next_sibling()
+                next_idx += 1
+                next_element = _sibling_at(siblings, next_idx)
 
             # Handle blockquote (optional)
             if next_element and next_element.name == "blockquote":
@@ -3542,20 +3895,23 @@ def _process_projects_or_certifications(
             # If no blockquote, look for organization info directly
             elif next_element:
                 # Try to find organization info (could be bold text or heading)
-                if next_element.name in ["h4", "h5", "h6", "p"] and next_element.find(
-                    "strong"
-                ):
+                org_strong = (
+                    next_element.find("strong")
+                    if next_element.name in ["h4", "h5", "h6", "p"]
+                    else None
+                )
+                if org_strong:
                     # Extract organization text
-                    org_text = next_element.find("strong").text.strip()
+                    org_text = org_strong.text.strip()
                     org_para = document.add_paragraph()
                     org_run = org_para.add_run(org_text)
 
                     _apply_font_properties(org_run.font, {"bold": True})
 
                     # Look for date information in the next element
-                    date_element = next_element.find_next_sibling()
-                    if date_element and date_element.find("em"):
-                        em_tag = date_element.find("em")
+                    date_element = _sibling_at(siblings, next_idx + 1)
+                    em_tag = date_element.find("em") if date_element else None
+                    if em_tag:
                         date_text = em_tag.text.strip()
                         date_para = document.add_paragraph()
 
@@ -3571,8 +3927,6 @@ def _process_projects_or_certifications(
             # Add spacing after each certification
             # _add_space_paragraph(document)
 
-        current_element = current_element.find_next_sibling()
-
 
 def _process_project_or_certification_blockquote(
     document: DOCX_Document,
@@ -3593,7 +3947,7 @@ def _process_project_or_certification_blockquote(
     org_element, _ = _find_organization_element(blockquote)
 
     if org_element:
-        if org_element.name in ["h4", "h5", "h6"]:
+        if org_element.name in MINOR_HEADING_TAGS:
             _create_heading_with_formatting_preservation(
                 document,
                 org_element,
@@ -3608,19 +3962,19 @@ def _process_project_or_certification_blockquote(
                 _apply_font_properties(org_run.font, {"bold": True})
 
     # Process all other content
-    for item in blockquote.contents:
-        if item == org_element or (isinstance(item, str) and not item.strip()):
+    for item in _significant_children(blockquote):
+        if item == org_element:
             continue
 
-        if (
-            hasattr(item, "name")
-            and item.name
-            and item.name.startswith("h")
-            and item != org_element
-        ):
+        # Only non-blank text nodes are left once tags are ruled out
+        if isinstance(item, str):
+            para = document.add_paragraph()
+            _process_text_for_hyperlinks(para, item.strip())
+
+        elif item.name.startswith("h"):
             _create_heading_with_formatting_preservation(document, item)
 
-        elif hasattr(item, "name") and item.name == "p" and item != org_element:
+        elif item.name == "p":
             if not _process_date_paragraph(document, item):
                 # Regular paragraph
                 para = document.add_paragraph()
@@ -3640,13 +3994,9 @@ def _process_project_or_certification_blockquote(
                     para, item, add_colon_to_strong=has_key_skills_heading
                 )
 
-        elif hasattr(item, "name") and item.name == "ul":
+        elif item.name == "ul":
             _add_bullet_list(document, item)
 
-        elif isinstance(item, str) and item.strip():
-            para = document.add_paragraph()
-            _process_text_for_hyperlinks(para, item.strip())
-
 
 def _process_element_children_with_formatting(
     paragraph: DOCX_Paragraph, element: BS4_Element, add_colon_to_strong: bool = False
@@ -3804,11 +4154,11 @@ def _add_configured_page_numbers(document: DOCX_Document) -> None:
         )
 
         fldChar1 = OxmlElement("w:fldChar")
-        fldChar1.set(qn("w:fldCharType"), "begin")
+        fldChar1.set(QN_W_FLD_CHAR_TYPE, "begin")
         instrText = OxmlElement("w:instrText")
         instrText.text = "PAGE"
         fldChar2 = OxmlElement("w:fldChar")
-        fldChar2.set(qn("w:fldCharType"), "end")
+        fldChar2.set(QN_W_FLD_CHAR_TYPE, "end")
 
         run._r.append(fldChar1)
         run._r.append(instrText)
@@ -3848,11 +4198,11 @@ def _add_configured_page_numbers(document: DOCX_Document) -> None:
                 )
 
                 fldChar1 = OxmlElement("w:fldChar")
-                fldChar1.set(qn("w:fldCharType"), "begin")
+                fldChar1.set(QN_W_FLD_CHAR_TYPE, "begin")
                 instrText1 = OxmlElement("w:instrText")
                 instrText1.text = "PAGE"
                 fldChar2 = OxmlElement("w:fldChar")
-                fldChar2.set(qn("w:fldCharType"), "end")
+                fldChar2.set(QN_W_FLD_CHAR_TYPE, "end")
                 run1._r.append(fldChar1)
                 run1._r.append(instrText1)
                 run1._r.append(fldChar2)
@@ -3879,11 +4229,11 @@ def _add_configured_page_numbers(document: DOCX_Document) -> None:
                 )
 
                 fldChar3 = OxmlElement("w:fldChar")
-                fldChar3.set(qn("w:fldCharType"), "begin")
+                fldChar3.set(QN_W_FLD_CHAR_TYPE, "begin")
                 instrText2 = OxmlElement("w:instrText")
                 instrText2.text = "NUMPAGES"
                 fldChar4 = OxmlElement("w:fldChar")
-                fldChar4.set(qn("w:fldCharType"), "end")
+                fldChar4.set(QN_W_FLD_CHAR_TYPE, "end")
                 run2._r.append(fldChar3)
                 run2._r.append(instrText2)
                 run2._r.append(fldChar4)
@@ -3903,11 +4253,11 @@ def _add_configured_page_numbers(document: DOCX_Document) -> None:
 ##############################
 # Interactive Mode Helper
 ##############################
-def _run_interactive_mode() -> tuple[Path, Path, dict[str, bool], bool, ConfigLoader]:
+def _run_interactive_mode() -> tuple[Path, Path, bool, ConfigLoader]:
     """Run in interactive mode, prompting the user for inputs
 
     Returns:
-        tuple: (input_file, output_file, paragraph_style_headings, create_pdf, config_loader)
+        tuple: (input_file, output_file, create_pdf, config_loader)
     """
     print("\n🎯 Welcome to Resume Markdown to ATS Converter (Interactive Mode) 🎯\n")
 
@@ -3931,9 +4281,15 @@ def _run_interactive_mode() -> tuple[Path, Path, dict[str, bool], bool, ConfigLo
             print("❌ Input file path cannot be empty. Please try again.")
             continue
 
-        if not os.path.exists(input_file):
+        # Opening the file both checks that it exists and that it is readable
+        try:
+            Path(input_file).open("rb").close()
+        except FileNotFoundError:
             print(f"❌ File '{input_file}' does not exist. Please enter a valid path.")
             continue
+        except (IsADirectoryError, PermissionError) as e:
+            print(f"❌ Cannot read '{input_file}': {e.strerror}. Please try again.")
+            continue
 
         break
 
@@ -3942,14 +4298,15 @@ def _run_interactive_mode() -> tuple[Path, Path, dict[str, bool], bool, ConfigLo
     # Get output file
     output_file = OutputFilePath(input_file=input_file, interactive=True).output_path()
 
-    print("\n⚙️ Processing your resume...\n")
+    print("\n⚙️ Processing your resume...\n", flush=True)
 
     create_pdf = (
         input("📄 Also create a PDF version? (y/n, default: n): ").strip().lower()
         == "y"
     )
     if create_pdf:
-        print("✅ Will generate PDF output")
+        # Flush so the message shows before the slow document and PDF conversion
+        print("✅ Will generate PDF output", flush=True)
 
     # Return the ConfigLoader object directly instead of just the config_file path
     return input_file, output_file, create_pdf, config_loader
@@ -3960,44 +4317,72 @@ def _run_interactive_mode() -> tuple[Path, Path, dict[str, bool], bool, ConfigLo
 ##############################
 def _convert_with_docx2pdf(docx_file: str, pdf_file: str) -> bool:
     """Convert using docx2pdf library"""
-    try:
-        from docx2pdf import convert
-
-        convert(docx_file, pdf_file)
-        return os.path.exists(pdf_file)
-    except ImportError:
+    if _docx2pdf_convert is None:
         return False
 
+    _docx2pdf_convert(docx_file, pdf_file)
+    return os.path.exists(pdf_file)
 
-def _convert_with_libreoffice(docx_file: str, pdf_file: str) -> bool:
-    """Convert using LibreOffice command line"""
-    import platform
-    import subprocess
 
-    # Find the LibreOffice executable based on platform
-    if platform.system() == "Windows":
+@functools.lru_cache(maxsize=1)
+def _resolve_libreoffice_exec() -> str | None:
+    """Find the LibreOffice executable for the current platform
+
+    The result is cached, so the candidate paths are probed once per process.
+
+    Returns:
+        str or None: Path to the LibreOffice executable, or None if not found
+    """
+    if PLATFORM_SYSTEM == "Windows":
         for path in PdfConverterPaths.LIBREOFFICE_WINDOWS.value:
             if os.path.exists(path):
-                lo_exec = path
-                break
-        else:
-            return False
-    elif platform.system() == "Darwin":  # macOS
+                return path
+        return None
+    elif PLATFORM_SYSTEM == "Darwin":  # macOS
         lo_exec = PdfConverterPaths.LIBREOFFICE_MACOS.value
-        if not os.path.exists(lo_exec):
-            return False
+        return lo_exec if os.path.exists(lo_exec) else None
     else:  # Linux/Unix
-        lo_exec = PdfConverterPaths.LIBREOFFICE_LINUX.value  # Assume it's in PATH
+        return shutil.which(PdfConverterPaths.LIBREOFFICE_LINUX.value)
+
+
+def _convert_with_libreoffice(
+    docx_file: str, pdf_file: str, profile_dir: str | None = None
+) -> bool:
+    """Convert using LibreOffice command line
+
+    Args:
+        docx_file (str): Path to the input DOCX file
+        pdf_file (str): Path to the output PDF file
+        profile_dir (str, optional): Separate LibreOffice user profile directory,
+            needed when several conversions run at the same time. Defaults to None.
+
+    Returns:
+        bool: True if the PDF file was created, False otherwise
+    """
+    # Find the LibreOffice executable based on platform
+    lo_exec = _resolve_libreoffice_exec()
+    if lo_exec is None:
+        return False
+
+    # Each running instance needs its own profile, otherwise they wait on its lock
+    profile_args = (
+        [f"-env:UserInstallation={Path(profile_dir).resolve().as_uri()}"]
+        if profile_dir
+        else []
+    )
+
+    pdf_dir = os.path.dirname(pdf_file) or "."
 
     try:
         subprocess.run(
             [
                 lo_exec,
+                *profile_args,
                 "--headless",
                 "--convert-to",
                 "pdf",
                 "--outdir",
-                os.path.dirname(pdf_file) or ".",
+                pdf_dir,
                 docx_file,
             ],
             check=True,
@@ -4005,54 +4390,194 @@ def _convert_with_libreoffice(docx_file: str, pdf_file: str) -> bool:
         )
 
         # LibreOffice saves to the original filename with .pdf extension
-        temp_pdf = (
-            os.path.splitext(os.path.basename(docx_file))[0] + f".{PDF_EXTENSION}"
-        )
-        temp_pdf_path = os.path.join(os.path.dirname(pdf_file) or ".", temp_pdf)
+        temp_pdf = f"{Path(docx_file).stem}.{PDF_EXTENSION}"
 
-        # If the output path is different from LibreOffice's default, move the file
-        if os.path.abspath(temp_pdf_path) != os.path.abspath(pdf_file):
-            os.rename(temp_pdf_path, pdf_file)
+        # If the output name is different from LibreOffice's default, move the file
+        # (os.replace raises if LibreOffice did not write it)
+        if temp_pdf != os.path.basename(pdf_file):
+            os.replace(os.path.join(pdf_dir, temp_pdf), pdf_file)
+            return True
 
         return os.path.exists(pdf_file)
     except (subprocess.SubprocessError, OSError):
         return False
 
 
+def _convert_batch_with_libreoffice(pairs: list[tuple[str, str]]) -> list[bool]:
+    """Convert several DOCX files to PDF with LibreOffice instances running in parallel
+
+    Each worker thread creates one LibreOffice profile and reuses it for all of its
+    conversions, so the profile is only set up once per worker.
+
+    Args:
+        pairs (list): (docx_file, pdf_file) paths to convert
+
+    Returns:
+        list: Whether each conversion succeeded, in the order of pairs
+    """
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    if len(pairs) <= 1:
+        return [_convert_with_libreoffice(*pair) for pair in pairs]
+
+    max_workers = min(len(pairs), max(1, (os.cpu_count() or 2) // 2))
+
+    # The profiles are removed with this directory once the pool has shut down
+    with tempfile.TemporaryDirectory(prefix="lo_") as profiles_dir:
+
+        def init_worker() -> None:
+            _LIBREOFFICE_PROFILES.profile_dir = tempfile.mkdtemp(
+                prefix="lo_", dir=profiles_dir
+            )
+
+        def convert(pair: tuple[str, str]) -> bool:
+            return _convert_with_libreoffice(
+                *pair, profile_dir=_LIBREOFFICE_PROFILES.profile_dir
+            )
+
+        # Threads are enough here, each conversion runs in its own soffice process
+        with ThreadPoolExecutor(
+            max_workers=max_workers, initializer=init_worker
+        ) as executor:
+            return list(executor.map(convert, pairs))
+
+
+@functools.lru_cache(maxsize=1)
+def _word_application():
+    """Start a hidden Microsoft Word instance shared by main thread conversions
+
+    The instance is cached for the lifetime of the process, so Word is started
+    once and shut down when the interpreter exits. COM objects belong to the
+    thread that created them, so it must only be used from the main thread.
+
+    Returns:
+        The Word.Application COM object
+    """
+    word = _win32com_client.Dispatch("Word.Application")
+    word.Visible = False
+    atexit.register(_quit_word_application)
+
+    return word
+
+
+def _quit_word_application() -> None:
+    """Shut down the shared Word instance, if one has been started"""
+    if not _word_application.cache_info().currsize:
+        return
+
+    try:
+        _word_application().Quit()
+    except Exception:
+        pass
+    _word_application.cache_clear()
+
+
 def _convert_with_win32com(docx_file: str, pdf_file: str) -> bool:
     """Convert using Microsoft Word COM automation (Windows only)"""
-    import platform
-
-    if platform.system() != "Windows":
+    if PLATFORM_SYSTEM != "Windows" or _win32com_client is None:
         return False
 
-    try:
-        import win32com.client
+    # Only the main thread reuses the shared instance
+    if threading.current_thread() is not threading.main_thread():
+        return _convert_with_win32com_in_thread(docx_file, pdf_file)
 
-        word = win32com.client.Dispatch("Word.Application")
-        word.Visible = False
+    doc = None
+    try:
+        word = _word_application()
 
         doc = word.Documents.Open(os.path.abspath(docx_file))
         doc.SaveAs(os.path.abspath(pdf_file), FileFormat=17)  # 17 = PDF
         doc.Close()
-        word.Quit()
 
         return os.path.exists(pdf_file)
-    except ImportError:
-        return False
     except Exception:
         # Clean up Word process if something went wrong
         try:
-            doc.Close(False)
-            word.Quit()
+            if doc is not None:
+                doc.Close(False)
         except:
             pass
+        _quit_word_application()
+        return False
+
+
+def _convert_with_win32com_in_thread(docx_file: str, pdf_file: str) -> bool:
+    """Convert with a Word instance of its own, for threads other than the main one
+
+    Args:
+        docx_file (str): Path to the input DOCX file
+        pdf_file (str): Path to the output PDF file
+
+    Returns:
+        bool: True if the PDF file was created, False otherwise
+    """
+    _pythoncom.CoInitialize()
+    word = None
+    doc = None
+    try:
+        word = _win32com_client.DispatchEx("Word.Application")
+        word.Visible = False
+
+        doc = word.Documents.Open(os.path.abspath(docx_file))
+        doc.SaveAs(os.path.abspath(pdf_file), FileFormat=17)  # 17 = PDF
+        doc.Close()
+        doc = None
+
+        return os.path.exists(pdf_file)
+    except Exception:
         return False
+    finally:
+        try:
+            if doc is not None:
+                doc.Close(False)
+            if word is not None:
+                word.Quit()
+        except Exception:
+            pass
+        _pythoncom.CoUninitialize()
+
+
+@functools.lru_cache(maxsize=1)
+def _available_pdf_converters() -> tuple:
+    """Get the PDF conversion methods whose tools are available, in order of preference
+
+    The result is cached, so missing tools are only probed once per process.
+
+    Returns:
+        tuple: The available _convert_with_* functions
+    """
+    methods = []
+    if _docx2pdf_convert is not None:
+        methods.append(_convert_with_docx2pdf)
+    if _resolve_libreoffice_exec() is not None:
+        methods.append(_convert_with_libreoffice)
+    if PLATFORM_SYSTEM == "Windows" and _win32com_client is not None:
+        methods.append(_convert_with_win32com)
+
+    return tuple(methods)
 
 
 ##############################
 # Utility Helpers
 ##############################
+def _markdown_to_html(md_content: str) -> str:
+    """Convert markdown to HTML, reusing one Markdown instance per thread
+
+    Args:
+        md_content (str): Markdown text to convert
+
+    Returns:
+        str: The converted HTML
+    """
+    converter = getattr(_MARKDOWN_CONVERTERS, "converter", None)
+    if converter is None:
+        converter = _MARKDOWN_CONVERTERS.converter = markdown.Markdown()
+
+    # reset() clears the state left over from the previous document
+    return converter.reset().convert(md_content)
+
+
 def _url_image(
     img_para: DOCX_Paragraph,
     img_url: str,
@@ -4140,19 +4665,41 @@ def _paragraph_alignment(
         paragraph.alignment = DOCX_PARAGRAPH_ALIGN.CENTER
 
 
+def _last_paragraph(container: DOCX_Document) -> DOCX_Paragraph | None:
+    """Get the last top-level paragraph of a document or cell
+
+    Scans the container's XML children from the end instead of materializing
+    ``container.paragraphs``, which wraps every paragraph in the container.
+
+    Args:
+        container: The Word document or table cell
+
+    Returns:
+        DOCX_Paragraph or None: The last paragraph, or None if there is none
+    """
+    block_container = getattr(container, "_body", container)
+    for child in reversed(block_container._element):
+        if child.tag == QN_W_P:
+            return DOCX_Paragraph(child, block_container)
+    return None
+
+
 def _left_indent_paragraph(
-    paragraph: DOCX_Paragraph, inches: float = 0.25
+    paragraph: DOCX_Paragraph, inches: float | Length = DEFAULT_LEFT_INDENT
 ) -> DOCX_Paragraph:
     """Set the left indentation of a paragraph in inches
 
     Args:
         paragraph: The paragraph object to modify
-        inches (float): Amount of indentation in inches
+        inches (float | Length): Amount of indentation in inches, or a precomputed
+                                 Length to skip the conversion
 
     Returns:
         paragraph: The modified paragraph object
     """
-    paragraph.paragraph_format.left_indent = Inches(inches)
+    if not isinstance(inches, Length):
+        inches = Inches(inches)
+    paragraph.paragraph_format.left_indent = inches
     return paragraph
 
 
@@ -4166,25 +4713,61 @@ def _process_list_item_formatting(
         li_element: BeautifulSoup element for the list item
         ensure_ending: Whether to ensure the text ends with proper sentence ending
     """
+    # Consecutive regular text is collected and added as a single run
+    plain_text = []
+
     # Process the item content to preserve formatting
     for child in li_element.children:
+        name = getattr(child, "name", None)
+        is_link = name == "a" and child.get("href")
+
+        # Regular text
+        if name not in ("strong", "em") and not is_link:
+            if child.string:
+                text = child.string
+                if ensure_ending:
+                    text = _ensure_sentence_ending(text)
+                plain_text.append(text)
+            continue
+
+        if plain_text:
+            paragraph.add_run("".join(plain_text))
+            plain_text.clear()
+
         # Handle bold text (strong tags)
-        if getattr(child, "name", None) == "strong":
+        if name == "strong":
             run = paragraph.add_run(child.text)
             _apply_font_properties(run.font, {"bold": True})
         # Handle italic text (em tags)
-        elif getattr(child, "name", None) == "em":
+        elif name == "em":
             run = paragraph.add_run(child.text)
             _apply_font_properties(run.font, {"italic": True})
         # Handle links
-        elif getattr(child, "name", None) == "a" and child.get("href"):
+        else:
             _add_hyperlink(paragraph, child.text, child.get("href"))
-        # Regular text
-        elif child.string:
-            text = child.string
-            if ensure_ending:
-                text = _ensure_sentence_ending(text)
-            paragraph.add_run(text)
+
+    if plain_text:
+        paragraph.add_run("".join(plain_text))
+
+
+def _run_xml(text: str, bold: bool = False) -> str:
+    """Build the XML of a plain text run, as Paragraph.add_run would create it
+
+    Tabs and line breaks are not converted, callers must check the text with
+    RUN_CONTROL_CHARS first.
+
+    Args:
+        text: Text of the run (without tabs or line breaks)
+        bold: Whether the run should be bold
+
+    Returns:
+        str: The w:r element as an XML string
+    """
+    run_properties = "<w:rPr><w:b/></w:rPr>" if bold else ""
+    # Leading or trailing whitespace is only kept with xml:space="preserve"
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+
+    return f"<w:r>{run_properties}<w:t{space}>{xml_escape(text)}</w:t></w:r>"
 
 
 def _format_skills_list(
@@ -4210,19 +4793,22 @@ def _format_skills_list(
         # Create paragraph with bold skills and plain separators
         skills_para = document.add_paragraph()
 
-        for i, skill in enumerate(skills):
-            # Add separator before skills (except the first one)
-            if i > 0:
-                skills_para.add_run(separator)
+        # Tabs and line breaks need the elements add_run creates for them
+        if RUN_CONTROL_CHARS.search(separator.join(skills)):
+            for i, skill in enumerate(skills):
+                # Add separator before skills (except the first one)
+                if i > 0:
+                    skills_para.add_run(separator)
 
-            # Add the skill with bold formatting
-            skill_run = skills_para.add_run(skill)
-            _apply_font_properties(
-                skill_run.font,
-                {
-                    "bold": True,
-                },
-            )
+                skill_run = skills_para.add_run(skill)
+                _apply_font_properties(skill_run.font, {"bold": True})
+
+            return skills_para
+
+        # Build all runs as one XML fragment and append them in a single step
+        separator_run = _run_xml(separator)
+        runs_xml = separator_run.join(_run_xml(skill, bold=True) for skill in skills)
+        skills_para._p.extend(parse_xml(f"<w:p {nsdecls('w')}>{runs_xml}</w:p>"))
 
         return skills_para
     else:
@@ -4260,7 +4846,7 @@ def _add_formatted_paragraph(
     """
     para = document.add_paragraph()
 
-    # Check if text contains URLs, emails, or markdown links
+    # Check if text contains URLs or emails
     is_link = _detect_link(text)[0]
 
     if bold or italic or not is_link:
@@ -4287,6 +4873,26 @@ def _add_formatted_paragraph(
     return para
 
 
+def _section_elements(section_h2: BS4_Element) -> Iterator[BS4_Element]:
+    """Iterate the elements of a section, from its h2 up to the next h2
+
+    Siblings are produced lazily, so nothing past the section is visited.
+
+    Args:
+        section_h2: The BeautifulSoup h2 element for the section
+
+    Yields:
+        BS4_Element: Each tag after the heading, in document order
+    """
+    for element in section_h2.next_siblings:
+        name = getattr(element, "name", None)
+        if name is None:
+            continue  # Text between tags
+        if name == "h2":
+            return
+        yield element
+
+
 def _has_hr_before_element(element: BS4_Element) -> bool:
     """Check if there's a horizontal rule (hr) element before any element
 
@@ -4303,8 +4909,20 @@ def _has_hr_before_element(element: BS4_Element) -> bool:
     return prev and prev.name == "hr"
 
 
+def _may_contain_link(text: str) -> bool:
+    """Cheap pre-check before running LINK_PATTERN on a text
+
+    Args:
+        text (str): Text to check
+
+    Returns:
+        bool: False if the text cannot contain a URL or an email address
+    """
+    return "@" in text or "http" in text or "www." in text
+
+
 def _detect_link(text: str) -> tuple[bool, str, str, str]:
-    """Detect if text contains any kind of link (markdown link, URL, or email)
+    """Detect if text contains any kind of link (URL or email)
 
     Args:
         text (str): Text to check
@@ -4316,28 +4934,28 @@ def _detect_link(text: str) -> tuple[bool, str, str, str]:
             - url (str): The URL for the hyperlink
             - matched_text (str): The full text that matched (for extraction)
     """
-    link_types = [
-        {
-            "pattern": MD_LINK_PATTERN,
-            "formatter": lambda m: (m.group(1), m.group(2), m.group(0)),
-        },
-        {
-            "pattern": URL_PATTERN,
-            "formatter": lambda m: (m.group(0), _format_url(m.group(0)), m.group(0)),
-        },
-        {
-            "pattern": EMAIL_PATTERN,
-            "formatter": lambda m: (m.group(0), f"mailto:{m.group(0)}", m.group(0)),
-        },
-    ]
+    match = LINK_PATTERN.search(text) if _may_contain_link(text) else None
+    if not match:
+        return False, text, "", ""
+
+    display_text, url = _link_from_match(match)
+    return True, display_text, url, match.group(0)
+
+
+def _link_from_match(match: re.Match) -> tuple[str, str]:
+    """Get the display text and URL of a link matched by LINK_PATTERN
 
-    for link_type in link_types:
-        match = link_type["pattern"].search(text)
-        if match:
-            display_text, url, matched_text = link_type["formatter"](match)
-            return True, display_text, url, matched_text
+    Args:
+        match (re.Match): Match object returned by LINK_PATTERN
 
-    return False, text, "", ""
+    Returns:
+        tuple: (display_text, url)
+    """
+    matched_text = match.group(0)
+    if match.lastgroup == "url":
+        return matched_text, _format_url(matched_text)
+    else:
+        return matched_text, f"mailto:{matched_text}"
 
 
 def _format_url(url: str) -> str:
@@ -4357,11 +4975,11 @@ def _format_url(url: str) -> str:
 def _process_text_for_hyperlinks(
     paragraph: DOCX_Paragraph, text: str, ensure_sentence_ending: bool = False
 ) -> None:
-    """Process text to detect and add hyperlinks for Markdown links, URLs and email addresses
+    """Process text to detect and add hyperlinks for URLs and email addresses
 
     Args:
         paragraph: The Word paragraph object to add content to
-        text (str): Text to process for Markdown links, URLs and email addresses
+        text (str): Text to process for URLs and email addresses
         ensure_sentence_ending (bool): Whether to add period at the end if missing
 
     Returns:
@@ -4371,40 +4989,34 @@ def _process_text_for_hyperlinks(
     if not text or not text.strip():
         return
 
-    remaining_text = text
-    fragments = []  # Store all text fragments and links
-
-    # First pass: Identify all links and text segments
-    while remaining_text:
-        is_link, link_text, url, matched_text = _detect_link(remaining_text)
+    # Skip the link scan when none of the link patterns can match
+    if not _may_contain_link(text):
+        paragraph.add_run(
+            _ensure_sentence_ending(text) if ensure_sentence_ending else text
+        )
+        return
 
-        if is_link:
-            # Find the start position of the link
-            link_position = remaining_text.find(matched_text)
+    fragments = []  # Store all text fragments and links
+    position = 0
 
-            # Add text before the link as a text fragment
-            if link_position > 0:
-                fragments.append(("text", remaining_text[:link_position]))
+    # First pass: Identify all links and text segments in a single scan
+    for match in LINK_PATTERN.finditer(text):
+        # Add text before the link as a text fragment
+        if match.start() > position:
+            fragments.append(("text", text[position : match.start()]))
 
-            # Add the link as a link fragment
-            fragments.append(("link", link_text, url))
+        # Add the link as a link fragment
+        fragments.append(("link", *_link_from_match(match)))
 
-            # Handle space after link
-            after_link_pos = link_position + len(matched_text)
-            if (
-                after_link_pos < len(remaining_text)
-                and remaining_text[after_link_pos] == " "
-            ):
-                fragments.append(("text", " "))
-                after_link_pos += 1
+        # Handle space after link
+        position = match.end()
+        if text.startswith(" ", position):
+            fragments.append(("text", " "))
+            position += 1
 
-            # Continue with remaining text
-            remaining_text = remaining_text[after_link_pos:]
-        else:
-            # No more links, add all remaining text
-            if remaining_text:
-                fragments.append(("text", remaining_text))
-            remaining_text = ""
+    # Add the text after the last link
+    if position < len(text):
+        fragments.append(("text", text[position:]))
 
     # Only add period to the very last text fragment if requested
     if ensure_sentence_ending and fragments and fragments[-1][0] == "text":
@@ -4436,32 +5048,20 @@ def _add_hyperlink(
     """
     # Get access to the document
     part = paragraph.part
-    # Create the relationship
-    r_id = part.relate_to(url, DOCX_REL.HYPERLINK, is_external=True)
+    # Create the relationship, reusing the one already created for this URL
+    # (relate_to scans all of the part's relationships on every call)
+    hyperlink_rids = _HYPERLINK_RIDS.setdefault(part, {})
+    r_id = hyperlink_rids.get(url)
+    if r_id is None:
+        r_id = part.relate_to(url, DOCX_REL.HYPERLINK, is_external=True)
+        hyperlink_rids[url] = r_id
 
-    # Create the hyperlink element
-    hyperlink = docx.oxml.shared.OxmlElement("w:hyperlink")
-    hyperlink.set(docx.oxml.shared.qn("r:id"), r_id)
+    # Create the hyperlink element, its run already references the Hyperlink style
+    hyperlink = copy.deepcopy(_HYPERLINK_TEMPLATE)
+    hyperlink.set(QN_R_ID, r_id)
 
-    # Create a run inside the hyperlink
-    new_run = docx.oxml.shared.OxmlElement("w:r")
-    rPr = docx.oxml.shared.OxmlElement("w:rPr")
-
-    # Create a run inside the hyperlink
-    new_run = docx.oxml.shared.OxmlElement("w:r")
-    rPr = docx.oxml.shared.OxmlElement("w:rPr")
-
-    # Apply the Hyperlink style by referencing it
-    style_id = docx.oxml.shared.OxmlElement("w:rStyle")
-    style_id.set(docx.oxml.shared.qn("w:val"), "Hyperlink")
-    rPr.append(style_id)
-
-    # Add the run properties to the run
-    new_run.append(rPr)
-    # Set the text
-    new_run.text = text
-    # Add the run to the hyperlink
-    hyperlink.append(new_run)
+    # Set the text of the run
+    hyperlink[0].text = text
 
     # Add the hyperlink to the paragraph
     paragraph._p.append(hyperlink)
@@ -4503,25 +5103,18 @@ def _add_horizontal_line_simple(document: DOCX_Document) -> None:
 
 def _add_space_paragraph(
     document: DOCX_Document,
-    font_size: int | None = None,
     space_before: int | None = None,
 ) -> None:
-    """Add a paragraph with extra space after it
+    """Add an empty paragraph to separate content
 
     Args:
         document: The Word document object
-        font_size (int, optional): Controls spacing after paragraph and run font size.
+        space_before (int, optional): Space before the paragraph in points.
 
     Returns:
         None
     """
-    if font_size is None:
-        font_size = ConfigHelper.get_style_constant("font_size_pts")
-
     p = document.add_paragraph()
-    p.add_run()
-    # run.text = " "  # Add a space character to create a blank line
-    # run.font.size = Pt(font_size)
     _add_space_before_or_after(p, space_before)
 
 
@@ -4561,13 +5154,28 @@ def _ensure_sentence_ending(text: str) -> str:
     text = text.rstrip()
 
     # If already ends with sentence-ending punctuation, return as-is
-    if text and text[-1] in [".", "!", "?", ":", ";"]:
+    if text and text[-1] in SENTENCE_ENDINGS:
         return text
 
     # Add a period
     return text + "."
 
 
+def _significant_children(node: BS4_Element) -> Iterator[BS4_Element]:
+    """Yield the direct children of an element, skipping whitespace-only text
+
+    Args:
+        node: BeautifulSoup element whose children to iterate
+
+    Yields:
+        BS4_Element: Each tag or non-blank text child, in document order
+    """
+    for item in node.contents:
+        if isinstance(item, str) and not item.strip():
+            continue
+        yield item
+
+
 def _find_organization_element(
     blockquote: BS4_Element,
 ) -> tuple[BS4_Element | None, bool]:
@@ -4579,13 +5187,13 @@ def _find_organization_element(
     Returns:
         tuple: (organization_element, was_processed)
     """
-    for item in blockquote.contents:
-        if isinstance(item, str) and not item.strip():
+    for item in _significant_children(blockquote):
+        if isinstance(item, str):
             continue
 
-        if hasattr(item, "name") and item.name in ["h4", "h5", "h6"]:
+        if item.name in MINOR_HEADING_TAGS:
             return item, False
-        elif hasattr(item, "name") and item.name == "p":
+        elif item.name == "p":
             strong_tag = item.find("strong")
             if strong_tag:
                 return item, False
@@ -4715,16 +5323,11 @@ def _apply_document_styles(
             # renderers (e.g. LibreOffice) don't fall back to the theme font instead
             # of the configured font name.
             if "font_name" in validated_props:
-                rPr = style.element.find(qn("w:rPr"))
+                rPr = style.element.find(QN_W_RPR)
                 if rPr is not None:
-                    rFonts = rPr.find(qn("w:rFonts"))
+                    rFonts = rPr.find(QN_W_RFONTS)
                     if rFonts is not None:
-                        for theme_attr in (
-                            qn("w:asciiTheme"),
-                            qn("w:hAnsiTheme"),
-                            qn("w:eastAsiaTheme"),
-                            qn("w:cstheme"),
-                        ):
+                        for theme_attr in QN_W_THEME_FONT_ATTRS:
                             rFonts.attrib.pop(theme_attr, None)
 
             # Apply paragraph format properties if the style supports them
@@ -4742,7 +5345,9 @@ def _apply_document_styles(
 __all__ = [
     "create_ats_resume",
     "convert_to_pdf",
+    "convert_many",
     "ConfigLoader",
+    "get_config_loader",
     "OutputFilePath",
     "DEFAULT_CONFIG_FILE",
     "DEFAULT_OUTPUT_DIR",
@@ -4781,6 +5386,10 @@ if __name__ == "__main__":
 
       python resume_md_to_docx.py -i resume.md -o resume.docx --pdf
           - Converts resume.md to resume.docx and resume.pdf
+
+      python resume_md_to_docx.py -i resume.md other/cv.md --pdf
+          - Converts both files in parallel to "output/resume.docx" and
+            "output/cv.docx", with a PDF of each
     """
 
     # Parse command line arguments with enhanced help
@@ -4790,7 +5399,13 @@ if __name__ == "__main__":
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    parser.add_argument("-i", "--input", dest="input_file", help="Input markdown file")
+    parser.add_argument(
+        "-i",
+        "--input",
+        dest="input_files",
+        nargs="+",
+        help="Input markdown file, or several files to convert in parallel",
+    )
     parser.add_argument(
         "-c",
         "--config",
@@ -4830,17 +5445,35 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Check if we should run in interactive mode
-    if not (args.input_file or args.output_file) or args.interactive:
+    if not (args.input_files or args.output_file) or args.interactive:
         # Now we get the config_loader object directly from _run_interactive_mode
         input_file, output_file, create_pdf, config_loader = _run_interactive_mode()
+    elif args.input_files and len(args.input_files) > 1:
+        if args.output_file:
+            parser.error("-o/--output can only be used with a single input file")
+
+        input_files = [Path(input_file) for input_file in args.input_files]
+        try:
+            results = convert_many(
+                input_files,
+                config_file=args.config_file,
+                create_pdf=args.create_pdf,
+                two_column=args.two_column,
+            )
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        for result in results:
+            print(f"🎉 ATS-friendly resume created: {result} 🎉")
+        sys.exit(0)
     else:
         config_loader = ConfigLoader(args.config_file)
 
         if args.two_column:
-            config_loader._config["document_defaults"]["two_column_enabled"] = True
+            config_loader.enable_two_column()
 
         # Use command-line arguments
-        input_file = Path(args.input_file)
+        input_file = Path(args.input_files[0])
 
         output_file = OutputFilePath(input_file, args.output_file).output_path()
 